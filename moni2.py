@@ -3,13 +3,43 @@
 import socket
 import threading
 import time
-import csv
 import os
 import signal
 import atexit
 import sys
+import collections
+import io
+import mmap
+import queue
+import select
+import re
+import types
+import logging
 import matplotlib
 import platform
+import numpy as np
+from functools import lru_cache
+
+# numba는 선택 사항 (없으면 같은 코드를 순수 파이썬으로 실행)
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """numba 미설치 시 대체 데코레이터 (함수를 그대로 반환)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# 디버그 출력 여부 (MONI_DEBUG=1/true/yes/on 환경변수로 활성화, 그 외 값은 비활성)
+_DEBUG = os.environ.get("MONI_DEBUG", "").strip().lower() in ("1", "true", "yes", "on")
+
+# 주기 갱신 경로의 진단 로그 (기본 WARNING: 평상시에는 경고만 출력)
+logging.basicConfig(format="%(message)s")
+logger = logging.getLogger("moni2")
+logger.setLevel(logging.DEBUG if _DEBUG else logging.WARNING)
 
 # PyInstaller 빌드를 위한 안전한 matplotlib 백엔드 설정
 def setup_matplotlib_backend():
@@ -97,8 +127,60 @@ import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
 import matplotlib.gridspec as gridspec
 import matplotlib.font_manager as fm
+from matplotlib.ticker import MaxNLocator, FuncFormatter
+
+# Agg 렌더링 최적화: 긴 선은 경로 단순화 후 나눠서 래스터화
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
 
 # PyInstaller 빌드를 위한 안전한 한글 폰트 설정
+# 선택된 폰트 목록 캐시 (재시작 시 폰트 검색 생략)
+FONT_CACHE_PATH = os.path.expanduser("~/.cache/moni2_font.txt")
+FONT_DIRS = ['/usr/share/fonts', '/usr/local/share/fonts',
+             os.path.expanduser('~/.fonts'), os.path.expanduser('~/.local/share/fonts'),
+             os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts')]
+
+def get_font_dirs_mtime():
+    """폰트 폴더들의 최근 변경 시각 (폰트 설치/삭제 감지용)"""
+    latest = 0.0
+    for font_dir in FONT_DIRS:
+        try:
+            latest = max(latest, os.stat(font_dir).st_mtime)
+        except OSError:
+            pass
+    return latest
+
+def load_cached_fonts():
+    """캐시된 폰트 목록 읽기 (폰트 폴더가 더 최근에 바뀌었거나 폰트 파일이 없어졌으면 None)
+    
+    캐시 한 줄 형식: 폰트 이름<TAB>폰트 파일 경로"""
+    try:
+        if os.stat(FONT_CACHE_PATH).st_mtime <= get_font_dirs_mtime():
+            return None
+        with open(FONT_CACHE_PATH, 'r', encoding='utf-8') as f:
+            lines = [line.rstrip('\n') for line in f if line.strip()]
+    except OSError:
+        return None
+    
+    fonts = []
+    for line in lines:
+        name, _, font_path = line.partition('\t')
+        # 하위 폴더(예: truetype/nanum)에 설치/삭제되면 폴더 시각이 안 바뀌므로 파일 존재를 직접 확인
+        if not font_path or not os.path.exists(font_path):
+            return None
+        fonts.append(name)
+    return fonts or None
+
+def save_cached_fonts(fonts, font_paths):
+    """선택된 폰트 목록을 파일 경로와 함께 캐시 파일에 저장"""
+    try:
+        os.makedirs(os.path.dirname(FONT_CACHE_PATH), exist_ok=True)
+        with open(FONT_CACHE_PATH, 'w', encoding='utf-8') as f:
+            f.write(''.join(f"{font}\t{font_paths[font]}\n" for font in fonts))
+    except OSError as e:
+        print(f"폰트 캐시 저장 실패: {e}")
+
 def setup_korean_font():
     """PyInstaller 빌드 환경에 안전한 한글 폰트 설정"""
     try:
@@ -112,15 +194,23 @@ def setup_korean_font():
             plt.rcParams['axes.unicode_minus'] = False
             return 'Malgun Gothic'
         
+        # 캐시된 폰트가 있으면 폰트 검색 생략
+        cached_fonts = load_cached_fonts()
+        if cached_fonts:
+            plt.rcParams['font.family'] = cached_fonts
+            plt.rcParams['axes.unicode_minus'] = False
+            print(f"한글 폰트 설정 완료 (캐시): {cached_fonts[0]}")
+            return cached_fonts[0]
+        
         # 일반 환경에서의 폰트 설정
         import matplotlib.font_manager as fm
         
         # 사용 가능한 한글 폰트 찾기 (안전하게)
         try:
-            available_fonts = [f.name for f in fm.fontManager.ttflist]
+            available_fonts = {f.name: f.fname for f in fm.fontManager.ttflist}  # 이름 → 파일 경로
         except Exception:
             # 폰트 매니저 실패 시 기본 폰트 사용
-            available_fonts = []
+            available_fonts = {}
         
         korean_fonts = []
         
@@ -147,6 +237,7 @@ def setup_korean_font():
         if korean_fonts:
             plt.rcParams['font.family'] = korean_fonts
             plt.rcParams['axes.unicode_minus'] = False
+            save_cached_fonts(korean_fonts, available_fonts)
             print(f"한글 폰트 설정 완료: {korean_fonts[0]}")
             return korean_fonts[0]
         else:
@@ -168,9 +259,8 @@ def setup_korean_font():
             pass  # 완전 실패 시 무시
         return 'sans-serif'
 
-# 폰트 초기화
-setup_korean_font()
-
+# 화면 크기는 실행 중 바뀌지 않으므로 한 번만 감지 (Tk/QApplication 재생성 방지)
+@lru_cache(maxsize=1)
 def get_optimal_figure_size():
     """화면 크기에 맞는 최적의 figure 크기 계산"""
     try:
@@ -238,6 +328,8 @@ def get_optimal_figure_size():
         # 라즈베리파이 기본값
         return (10, 6)
 
+# 반환 딕셔너리는 호출자 간에 공유되므로 읽기 전용으로 사용
+@lru_cache(maxsize=1)
 def get_font_sizes():
     """화면 크기에 맞는 폰트 크기 반환"""
     screen_size = get_optimal_figure_size()
@@ -310,64 +402,90 @@ def check_dependencies():
 # 의존성 확인
 check_dependencies()
 
-# 폰트 크기 설정
-font_sizes = get_font_sizes()
-print(f"폰트 크기 설정: 제목={font_sizes['title']}, 일반={font_sizes['normal']}")
+# 폰트 크기 설정 (build_ui에서 화면 크기 감지 후 결정)
+font_sizes = None
+
+@lru_cache(maxsize=8192)
+def _format_whole_seconds(total):
+    """정수 초를 분:초 문자열로 변환 (같은 초는 캐시 사용)"""
+    return f"{total // 60}:{total % 60:02d}"
 
 def format_time(seconds):
     """초를 분:초 형태로 변환"""
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
-    return f"{minutes}:{secs:02d}"
+    return _format_whole_seconds(int(seconds // 1))
+
+def format_time_tick(x, pos):
+    """X축 눈금용 분:초 변환 (FuncFormatter 콜백)"""
+    return _format_whole_seconds(int(x // 1))
 
 # UDP 수신기 설정 (disp → moni)
 UDP_IP = "0.0.0.0"      # 모든 IP에서 수신
 UDP_PORT = 12345        # 데이터 수신 포트
 DATA_FILE = "monitoring_data.csv"
 
+# 스크립트 위치 기준 파일 경로 (ON/OFF 때마다 다시 계산하지 않음)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+VIRTUAL_DATA_FILE = os.path.join(SCRIPT_DIR, "virtual_data.txt")
+STOP_SIGNAL_PATH = os.path.join(SCRIPT_DIR, "stop_signal.txt")
+START_SIGNAL_PATH = os.path.join(SCRIPT_DIR, "start_signal.txt")
+
 # 제어신호 송신 설정 (moni → disp)
 def detect_disp_ip():
     """실행 환경에 따라 disp.py의 IP 자동 감지"""
-    import platform
-    
     # Windows 환경에서는 localhost 사용
     if platform.system() == "Windows":
         print("Windows 환경 감지: localhost 사용")
         return "localhost"
     
-    # Linux 환경에서는 네트워크 IP 감지
+    # Linux 환경에서는 네트워크 IP 감지 (매 실행마다 감지 - 서브넷이 바뀌어도 바로 반영)
     try:
-        import socket
-        # 로컬 IP 획득
+        # 로컬 IP 획득 (UDP connect는 패킷을 보내지 않고 경로만 정하므로 대기 없음)
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))
         local_ip = s.getsockname()[0]
         s.close()
         
         if local_ip.startswith("192.168.0"):
-            return "192.168.0.12"
+            disp_ip = "192.168.0.12"
         elif local_ip.startswith("192.168.1"):
-            return "192.168.1.12"
+            disp_ip = "192.168.1.12"
         else:
-            return "192.168.0.12"
+            disp_ip = "192.168.0.12"
     except:
         return "192.168.0.12"
+    return disp_ip
 
 DISP_IP = detect_disp_ip()  # 자동 감지된 송신기(disp) IP
 CONTROL_PORT = 50001        # 제어 신호 포트
 
+# UDP 소켓 버퍼 크기 (OS 기본값이 작으면 몰리는 패킷이 버려짐, 실제 크기는 OS 상한까지)
+UDP_RCVBUF_SIZE = 8 << 20  # 8MB 수신 버퍼
+UDP_SNDBUF_SIZE = 1 << 20  # 1MB 송신 버퍼
+
+# 제어 신호(ON/OFF) 전송용 UDP 소켓 (클릭마다 만들고 닫지 않고 계속 재사용, 종료 시 닫음)
+control_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+control_sock.setblocking(False)
+try:
+    control_sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, UDP_SNDBUF_SIZE)
+except OSError as e:
+    print(f"제어 소켓 버퍼 설정 실패: {e}")
+
 print(f"제어 신호 타겟: {DISP_IP}:{CONTROL_PORT}")
 
 udp_thread = None
-data_rows = []
+# 수신 스레드 종료 신호 (OFF/종료 시 set, 스레드는 select 타임아웃마다 확인)
+udp_stop_event = threading.Event()
+MAX_DATA_POINTS = 3600  # 1시간 분량 (1초 간격 기준) - 메모리 누수 방지
+# 고정 크기 링 버퍼: 가득 차면 가장 오래된 데이터가 O(1)로 자동 제거됨
+data_rows = collections.deque(maxlen=MAX_DATA_POINTS)
 lock = threading.Lock()
 
-# 중복 데이터 방지를 위한 변수들
-last_received_data = {"content": "", "timestamp": 0}
-duplicate_prevention_lock = threading.Lock()
+# 중복 데이터 방지 시간 창 (마지막 패킷 정보는 udp_receiver 지역 변수)
+DUPLICATE_WINDOW_NS = 200_000_000  # 0.2초
 
 # 상태 순서 검증을 위한 변수
 expected_state_sequence = ["IDLE", "STARTUP", "MAIN_FUELING", "SHUTDOWN"]
+_STATE_IDX = {state: i for i, state in enumerate(expected_state_sequence)}
 current_sequence_index = [0]  # 현재 기대하는 상태 인덱스
 
 # ON/OFF 상태
@@ -375,8 +493,69 @@ data_on = [False]  # 리스트로 감싸서 클로저에서 변경 가능
 current_state = ["대기중"]  # 현재 상태
 
 
+# 패킷 파싱용 정규식 (bytes 단위로 한 번에 스캔)
+_STATE_RE = re.compile(rb'([^|]*)\|')          # STATE| 부분
+_PAIR_RE = re.compile(rb'([^,:]*):([^,]*)')     # field:value 쌍 (값에는 ':' 허용)
+
+@lru_cache(maxsize=256)
+def parse_packet(raw):
+    """UDP 패킷(bytes) 파싱: (상태, ((필드, 값), ...), 새 형식 여부) - 반복 패킷은 캐시 사용"""
+    raw = raw.strip()
+    
+    # 새로운 데이터 형식 파싱: STATE|field1:value1,field2:value2,...
+    match = _STATE_RE.match(raw)
+    if match:
+        # split 3단계 대신 정규식 한 번으로 필드:값 쌍 추출
+        items = tuple((field.decode('utf-8', errors='ignore').strip(),
+                       value.decode('utf-8', errors='ignore').strip())
+                      for field, value in _PAIR_RE.findall(raw, match.end()))
+        return match.group(1).decode('utf-8', errors='ignore'), items, True
+    
+    # 기존 형식 지원 (하위 호환성)
+    return raw.split(b',', 1)[0].decode('utf-8', errors='ignore'), (), False
+
+# 수신 스레드 로그 링버퍼 (수신 스레드는 쌓기만 하고 출력은 메인 타이머에서)
+_LOG_RING = collections.deque(maxlen=512)
+
+def ring_log(msg):
+    """수신 스레드용 로그: stdout에 직접 쓰지 않고 링버퍼에 저장"""
+    _LOG_RING.append(msg)
+
+def drain_ring_log():
+    """링버퍼에 쌓인 로그를 한 번에 출력 (메인 스레드에서 호출)"""
+    if not _LOG_RING:
+        return
+    out = []
+    while _LOG_RING:
+        out.append(_LOG_RING.popleft())
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+
+UDP_BATCH_SIZE = 32  # select로 한 번 깨어날 때 꺼낼 최대 패킷 수
+
+def receive_batch(sock, rxbuf, max_packets=UDP_BATCH_SIZE):
+    """논블로킹 소켓의 수신 버퍼에 대기 중인 UDP 패킷을 최대 max_packets개까지 꺼내기
+    
+    rxbuf는 재사용하는 수신 버퍼(memoryview)이며, 패킷은 실제 길이만큼만 bytes로 복사"""
+    packets = []
+    for _ in range(max_packets):
+        try:
+            nbytes = sock.recv_into(rxbuf)
+            packet = bytes(rxbuf[:nbytes])
+        except BlockingIOError:
+            break  # 버퍼 비었음
+        except OSError:
+            if packets:
+                break  # 이미 받은 패킷은 처리하고 오류는 다음 수신에서 확인
+            raise
+        packets.append(packet)
+    return packets
+
+
 def udp_receiver():
-    global data_rows  # 전역 변수 선언 추가
+    # 중복 데이터 방지용 (수신 스레드 전용이므로 lock 불필요)
+    last_hash = 0  # 마지막 패킷 해시
+    last_ns = 0    # 마지막 패킷 수신 시각 (time.monotonic_ns)
     
     # UDP 소켓 생성
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -384,183 +563,152 @@ def udp_receiver():
     
     # 성능 최적화: 소켓 버퍼 크기 증가 (패킷 손실 방지)
     try:
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)  # 64KB 수신 버퍼
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)  # 64KB 송신 버퍼
-        print("UDP 소켓 버퍼 최적화: 64KB")
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RCVBUF_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, UDP_SNDBUF_SIZE)
+        ring_log(f"UDP 소켓 버퍼 최적화: 수신 {sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) // 1024}KB")
     except Exception as e:
-        print(f"소켓 버퍼 설정 실패: {e}")
+        ring_log(f"소켓 버퍼 설정 실패: {e}")
     
     # 블로킹 모드 최적화 (CPU 사용량 감소)
     try:
         sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0x10)  # 최소 지연 설정
-        print("UDP 소켓 TOS 최적화")
+        ring_log("UDP 소켓 TOS 최적화")
     except Exception:
         pass  # Windows에서 지원하지 않을 수 있음
     
     sock.bind((UDP_IP, UDP_PORT))
-    sock.settimeout(0.05)  # 타임아웃 단축: 0.1초 → 0.05초 (응답성 향상)
-    print("UDP 수신기 시작됨 (성능 최적화)")
+    # 논블로킹 모드: 수신 대기는 select로 처리 (빈 버퍼 확인은 즉시 반환)
+    sock.setblocking(False)
+    ring_log("UDP 수신기 시작됨 (성능 최적화)")
     
     # 성능 카운터 추가
     packet_count = 0
     error_count = 0
-    last_stats_time = time.time()
+    last_stats_ns = time.monotonic_ns()
     
-    # 소켓 버퍼 비우기 (이전 데이터 제거)
-    try:
-        sock.settimeout(0.01)  # 아주 짧은 타임아웃으로
-        discarded_count = 0
-        while True:
-            try:
-                old_data, _ = sock.recvfrom(2048)
-                discarded_count += 1
-                if discarded_count > 100:  # 무한 루프 방지
-                    break
-            except socket.timeout:
-                break
-        if discarded_count > 0:
-            print(f"이전 UDP 데이터 {discarded_count}개 정리됨")
-        sock.settimeout(0.1)  # 원래 타임아웃으로 복원
-    except Exception as e:
-        print(f"UDP 버퍼 정리 중 오류: {e}")
-        sock.settimeout(0.1)
+    # 재사용 수신 버퍼 (패킷마다 4096바이트 할당 방지)
+    rxbuf = memoryview(bytearray(4096))
     
-    while True:
-        if not data_on[0]:
-            time.sleep(0.1)
-            continue
-            
-        line = None
-        timestamp = time.time()
-        
-        # UDP에서 데이터 수신
+    # 소켓 버퍼 비우기 (이전 데이터 제거) - 버퍼가 비면 대기 없이 바로 종료
+    discarded_count = 0
+    while discarded_count < 1024:  # 무한 루프 방지
         try:
-            packet, addr = sock.recvfrom(4096)  # 버퍼 크기 증가: 2048 → 4096
-            line = packet.decode('utf-8', errors='ignore').strip()  # 안전한 디코딩
-            current_time = time.time()
-            
-            # 성능 통계 업데이트
-            packet_count += 1
-            
-            # 1초(1000ms)마다 수신한 패킷 원본 출력 (그래프 업데이트와 동기화)
-            if current_time - last_stats_time >= 1.0:
-                print(f"{line}")
-                last_stats_time = current_time
-                
-        except socket.timeout:
-            # OFF 상태인지 다시 확인
-            if not data_on[0]:
-                # print("UDP 수신기: OFF 상태 감지, 수신 중단")
+            sock.recv_into(rxbuf)
+        except BlockingIOError:
+            break
+        discarded_count += 1
+    if discarded_count > 0:
+        ring_log(f"이전 UDP 데이터 {discarded_count}개 정리됨")
+    
+    # 수신 경로: select 대기 후 깨어날 때마다 쌓인 패킷을 한 번에 처리
+    while not udp_stop_event.is_set():
+        # 데이터 도착까지 최대 0.05초 대기 (응답성 유지)
+        try:
+            readable, _, _ = select.select([sock], [], [], 0.05)
+        except (OSError, ValueError) as e:
+            error_count += 1
+            if error_count > 10:  # 연속 오류 시 소켓 재시작
                 break
-            # 타임아웃은 정상 동작이므로 조용히 계속
             continue
-            
-        except (UnicodeDecodeError, socket.error) as e:
+        
+        if not readable:
+            # 타임아웃은 정상 동작이므로 조용히 계속 (루프 조건에서 종료 신호 확인)
+            continue
+        
+        # 커널 수신 버퍼에 쌓인 패킷을 한 번에 꺼냄
+        try:
+            packets = receive_batch(sock, rxbuf)
+        except OSError as e:
             error_count += 1
             # print(f"UDP 수신 오류 #{error_count}: {e}")
             if error_count > 10:  # 연속 오류 시 소켓 재시작
                 # print("UDP 소켓 재시작 필요")
                 break
             continue
-        except Exception as e:
-            error_count += 1
-            # print(f"예상치 못한 UDP 오류: {e}")
-            continue
-        
-        if not line:
-            time.sleep(0.1)
-            continue
         
-        # 상태 순서 검증 - 첫 수신 후 순서대로 진행
-        if '|' in line:
-            temp_state = line.split('|', 1)[0]
-            current_index = current_sequence_index[0]
+        for packet in packets:
+            # 시각은 패킷당 한 번만 읽음: 간격/중복 판단은 monotonic, 저장용은 벽시계
+            now_ns = time.monotonic_ns()
+            timestamp = time.time()
             
-            # print(f"상태 검증: 현재인덱스={current_index}({expected_state_sequence[current_index]}), 수신상태={temp_state}")
+            # 성능 통계 업데이트
+            packet_count += 1
             
-            # 데이터가 없거나 처음 수신하는 경우 - 어떤 상태든 허용
-            if len(data_rows) == 0:
-                if temp_state in expected_state_sequence:
-                    new_index = expected_state_sequence.index(temp_state)
-                    current_sequence_index[0] = new_index
-                    # print(f"첫 데이터 수신: {temp_state} (인덱스 {new_index})")
-                else:
-                    pass
-                    # print(f"알 수 없는 상태이지만 첫 데이터로 허용: {temp_state}")
-            elif temp_state == "IDLE":
-                # IDLE은 언제나 허용 (리셋)
-                current_sequence_index[0] = 0
-                # print(f"IDLE 상태로 리셋: 인덱스 0")
-            elif temp_state in expected_state_sequence:
-                expected_index = expected_state_sequence.index(temp_state)
-                
-                # 다음 순서 상태이면 허용
-                if expected_index == current_index + 1:
-                    current_sequence_index[0] = expected_index
-                    # print(f"다음 상태로 진행: {temp_state} (인덱스 {expected_index})")
-                # 현재 상태와 같으면 허용 (반복)
-                elif expected_index == current_index:
-                    pass
-                    # print(f"현재 상태 반복: {temp_state}")
-                # 그 외는 무시
-                else:
-                    # print(f"순서 불일치 데이터 무시 (현재인덱스: {current_index}, 수신인덱스: {expected_index}): {line[:50]}...")
-                    continue
-        
-        # 새로운 데이터 형식 파싱: STATE|field1:value1,field2:value2,...
-        if '|' in line:
-            state_part, data_part = line.split('|', 1)
-            current_state[0] = state_part
+            # 1초(1000ms)마다 수신한 패킷 원본 출력 (MONI_DEBUG=1일 때만)
+            if _DEBUG and now_ns - last_stats_ns >= 1_000_000_000:
+                ring_log(packet.decode('utf-8', errors='ignore').strip())
+                last_stats_ns = now_ns
             
-            # 필드:값 쌍들을 파싱
-            field_value_pairs = data_part.split(',')
-            parsed_data = {'STATE': state_part}
-            for pair in field_value_pairs:
-                if ':' in pair:
-                    field, value = pair.split(':', 1)
-                    parsed_data[field.strip()] = value.strip()
-        else:
-            # 기존 형식 지원 (하위 호환성)
-            data_parts = line.split(",")
-            parsed_data = {'STATE': data_parts[0] if data_parts else 'UNKNOWN'}
-            current_state[0] = parsed_data['STATE']
-        
-        # 중복 데이터 방지 로직 (더 엄격하게)
-        with duplicate_prevention_lock:
+            if not packet.strip():
+                continue
+            
+            # 중복 데이터 방지 로직 - 원본 바이트 해시로 파싱 전에 걸러냄
+            packet_hash = hash(packet)
             # 동일한 내용의 데이터가 0.2초 이내에 중복 수신되면 완전히 무시
-            if (line == last_received_data["content"] and 
-                timestamp - last_received_data["timestamp"] < 0.2):
-                # print(f"중복 데이터 무시: {line[:50]}...")  # 로그 제거
+            if packet_hash == last_hash and now_ns - last_ns < DUPLICATE_WINDOW_NS:
+                # print(f"중복 데이터 무시: {packet[:50]}...")  # 로그 제거
                 continue
             
-            # 마지막 수신 데이터 업데이트
-            last_received_data["content"] = line
-            last_received_data["timestamp"] = timestamp
-        
-        with lock:
-            # 메모리 최적화: 최대 데이터 개수 제한 (메모리 누수 방지)
-            MAX_DATA_POINTS = 3600  # 1시간 분량 (1초 간격 기준)
+            # 파싱 (같은 패킷이 반복되면 캐시된 결과 사용)
+            temp_state, items, is_framed = parse_packet(packet)
             
-            # 파싱된 데이터를 저장
-            data_rows.append([timestamp, parsed_data])
-            # 마지막 수신 시간 기록 (데이터 누락 감지용)
-            udp_receiver.last_data_time = timestamp
+            # 상태 순서 검증 - 첫 수신 후 순서대로 진행
+            if is_framed:
+                current_index = current_sequence_index[0]
+                state_index = _STATE_IDX.get(temp_state, -1)  # 알 수 없는 상태는 -1
+                
+                # print(f"상태 검증: 현재인덱스={current_index}({expected_state_sequence[current_index]}), 수신상태={temp_state}")
+                
+                # 데이터가 없거나 처음 수신하는 경우 - 어떤 상태든 허용
+                if len(data_rows) == 0:
+                    if state_index >= 0:
+                        current_sequence_index[0] = state_index
+                        # print(f"첫 데이터 수신: {temp_state} (인덱스 {state_index})")
+                    else:
+                        pass
+                        # print(f"알 수 없는 상태이지만 첫 데이터로 허용: {temp_state}")
+                elif state_index == 0:
+                    # IDLE은 언제나 허용 (리셋)
+                    current_sequence_index[0] = 0
+                    # print(f"IDLE 상태로 리셋: 인덱스 0")
+                elif state_index > 0:
+                    # 다음 순서 상태이면 허용
+                    if state_index == current_index + 1:
+                        current_sequence_index[0] = state_index
+                        # print(f"다음 상태로 진행: {temp_state} (인덱스 {state_index})")
+                    # 현재 상태와 같으면 허용 (반복)
+                    elif state_index == current_index:
+                        pass
+                        # print(f"현재 상태 반복: {temp_state}")
+                    # 그 외는 무시
+                    else:
+                        # print(f"순서 불일치 데이터 무시 (현재인덱스: {current_index}, 수신인덱스: {state_index}): {packet[:50]}...")
+                        continue
             
-            # 메모리 관리: 오래된 데이터 자동 정리
-            if len(data_rows) > MAX_DATA_POINTS:
-                # 앞의 600개(10분) 데이터 제거하여 메모리 절약
-                removed_count = len(data_rows) - MAX_DATA_POINTS + 600
-                data_rows = data_rows[removed_count:]
-                # print(f"메모리 정리: {removed_count}개 오래된 데이터 제거")
+            # 캐시된 (필드, 값) 튜플로 행 딕셔너리 생성 (행마다 별도 객체)
+            current_state[0] = temp_state
+            parsed_data = {'STATE': temp_state}
+            parsed_data.update(items)
+            row_items = display_items(parsed_data)  # 문자열 조립은 lock 밖에서
+            
+            with lock:
+                # 파싱된 데이터를 저장
+                append_row(timestamp, parsed_data, row_items)
+                # 마지막 수신 시간 기록 (데이터 누락 감지용)
+                udp_receiver.last_data_time = now_ns  # time.monotonic_ns 기준
+                
+                # 성능 최적화: 간격 계산 (선택적 로깅)
+                if len(data_rows) > 1:
+                    prev_timestamp = data_rows[-2][0]
+                    interval = timestamp - prev_timestamp
+                    if interval > 1.5:  # 1.5초 이상 간격이면 경고
+                        pass
+                        # print(f"경고: {parsed_data['STATE']} - 긴 간격 감지! 누락의심")
+            
+            # 마지막 수신 데이터 업데이트 (검증을 통과해 저장된 패킷만 중복 판단 기준으로 사용)
+            last_hash = packet_hash
+            last_ns = now_ns
             
-            # 성능 최적화: 간격 계산 (선택적 로깅)
-            if len(data_rows) > 1:
-                prev_timestamp = data_rows[-2][0]
-                interval = timestamp - prev_timestamp
-                if interval > 1.5:  # 1.5초 이상 간격이면 경고
-                    pass
-                    # print(f"경고: {parsed_data['STATE']} - 긴 간격 감지! 누락의심")
-        
         # 메모리 효율적 저장 (실시간 파일 저장 제거)
     
     # 안전한 UDP 수신기 종료
@@ -577,47 +725,106 @@ def udp_receiver():
         # print(f"최종 통계: {packet_count}패킷 처리, {error_count}오류 발생")
 
 # --- 상태별 필드 정의 (SOC, 유량 공통 추가) ---
-state_fields = {
-    "IDLE": ["카테고리", "압력카테고리", "SW버전", "유지보수", "외기온도", "인렛압력", "출력압력", "SOC", "유량"],
-    "STARTUP": ["통신모드", "초기압력", "APRR", "타겟압력", "MP", "MT", "TV", "퓨얼링압력", "SOC", "유량"],
-    "MAIN_FUELING": ["설정출력압력", "MP", "MT", "TV", "퓨얼링압력", "SOC", "유량"],
-    "SHUTDOWN": ["MP", "MT", "TV", "퓨얼링압력", "출력수소온도", "충전시간", "최종충전량", "최종충전금액", "SOC", "유량"]
-}
+# 읽기 전용 (실행 중 실수로 수정되지 않도록 MappingProxyType + tuple)
+state_fields = types.MappingProxyType({
+    "IDLE": ("카테고리", "압력카테고리", "SW버전", "유지보수", "외기온도", "인렛압력", "출력압력", "SOC", "유량"),
+    "STARTUP": ("통신모드", "초기압력", "APRR", "타겟압력", "MP", "MT", "TV", "퓨얼링압력", "SOC", "유량"),
+    "MAIN_FUELING": ("설정출력압력", "MP", "MT", "TV", "퓨얼링압력", "SOC", "유량"),
+    "SHUTDOWN": ("MP", "MT", "TV", "퓨얼링압력", "출력수소온도", "충전시간", "최종충전량", "최종충전금액", "SOC", "유량")
+})
+
+# 헤더 없이 데이터만 들어오므로, 각 상태별 필드 인덱스 추정
+# row = [timestamp, state, ...fields...] → 0:timestamp, 1:state
+field_indices = {f: i + 2 for fields in state_fields.values() for i, f in enumerate(fields)}
 
 # --- 그래프 및 상태 패널 레이아웃 ---
 
-plt.ion()
-optimal_size = get_optimal_figure_size()
-fig = plt.figure(figsize=optimal_size)
-print(f"📱 화면 크기 설정: {optimal_size[0]}×{optimal_size[1]} 인치")
+# 화면 요소 (build_ui에서 생성)
+fig = None
+gs = None
+ax_btn_area = None
+ax_state = None
+ax_current = None
+ax_graph = None
+ax_slider_area = None
+
+def build_ui():
+    """그래프 창, 패널, 버튼 생성 (메인 스레드에서 화면이 필요할 때 한 번만 호출)"""
+    global fig, gs, ax_btn_area, ax_state, ax_current, ax_graph, ax_slider_area
+    global font_sizes, btn_on, btn_off, btn_reset, btn_load
+    
+    if fig is not None:
+        return
+    
+    # 폰트 초기화
+    setup_korean_font()
+    
+    # 폰트 크기 설정
+    font_sizes = get_font_sizes()
+    print(f"폰트 크기 설정: 제목={font_sizes['title']}, 일반={font_sizes['normal']}")
+    
+    # numba 사용 시 첫 그래프 갱신이 컴파일로 멈추지 않도록 미리 컴파일
+    if HAVE_NUMBA:
+        lttb_indices(np.arange(4.0), np.zeros(4), 3)
+    
+    plt.ion()
+    optimal_size = get_optimal_figure_size()
+    fig = plt.figure(figsize=optimal_size)
+    print(f"📱 화면 크기 설정: {optimal_size[0]}×{optimal_size[1]} 인치")
+
+    # 라즈베리파이 최적화된 레이아웃
+    gs = gridspec.GridSpec(3, 3, 
+                          height_ratios=[0.08, 0.82, 0.10], 
+                          width_ratios=[0.9, 0.6, 1.85],
+                          hspace=0.08, wspace=0.02)  # wspace 축소: 0.04 → 0.02
+
+    # 여백 조정 - 오른쪽 여백 더 증가
+    fig.subplots_adjust(left=0.02, right=0.94, top=0.95, bottom=0.08)
+
+    # 상단: 버튼 영역
+    ax_btn_area = plt.subplot(gs[0, :])
+    ax_btn_area.axis('off')
+
+    # 중간 왼쪽: 상태 패널
+    ax_state = plt.subplot(gs[1, 0])
+    ax_state.axis('off')
+
+    # 중간 가운데: 현재 값 패널 (새로 추가)
+    ax_current = plt.subplot(gs[1, 1])
+    ax_current.axis('off')
+
+    # 중간 오른쪽: 그래프 영역  
+    ax_graph = plt.subplot(gs[1, 2])
 
-# 라즈베리파이 최적화된 레이아웃
-gs = gridspec.GridSpec(3, 3, 
-                      height_ratios=[0.08, 0.82, 0.10], 
-                      width_ratios=[0.9, 0.6, 1.85],
-                      hspace=0.08, wspace=0.02)  # wspace 축소: 0.04 → 0.02
+    # 하단: 슬라이더 영역
+    ax_slider_area = plt.subplot(gs[2, 2])
+    ax_slider_area.axis('off')
 
-# 여백 조정 - 오른쪽 여백 더 증가
-fig.subplots_adjust(left=0.02, right=0.94, top=0.95, bottom=0.08)
+    # 화면 크기 변경 이벤트 연결
+    fig.canvas.mpl_connect('resize_event', on_resize)
 
-# 상단: 버튼 영역
-ax_btn_area = plt.subplot(gs[0, :])
-ax_btn_area.axis('off')
+    # 전체 그리기 완료 시 블리팅용 배경 캐시 갱신
+    fig.canvas.mpl_connect('draw_event', on_draw)
 
-# 중간 왼쪽: 상태 패널
-ax_state = plt.subplot(gs[1, 0])
-ax_state.axis('off')
+    # ON/OFF 버튼 생성 (왼쪽으로 이동)
+    ax_btn_on = plt.axes([0.30, 0.93, 0.07, 0.04])
+    ax_btn_off = plt.axes([0.38, 0.93, 0.07, 0.04])
+    ax_btn_reset = plt.axes([0.46, 0.93, 0.08, 0.04])  # 커서 리셋 버튼
+    ax_btn_load = plt.axes([0.55, 0.93, 0.08, 0.04])   # 불러오기 버튼 (SAVE 위치로 이동)
 
-# 중간 가운데: 현재 값 패널 (새로 추가)
-ax_current = plt.subplot(gs[1, 1])
-ax_current.axis('off')
+    btn_on = Button(ax_btn_on, 'ON', color='lightgreen', hovercolor='green')
+    btn_off = Button(ax_btn_off, 'OFF', color='lightcoral', hovercolor='red')
+    btn_reset = Button(ax_btn_reset, 'LIVE', color='white', hovercolor='blue')  # 기본은 색상 없음
+    btn_load = Button(ax_btn_load, 'LOAD', color='lightgray', hovercolor='gray')
 
-# 중간 오른쪽: 그래프 영역  
-ax_graph = plt.subplot(gs[1, 2])
+    btn_on.on_clicked(on_on)
+    btn_off.on_clicked(on_off)
+    btn_reset.on_clicked(on_reset_cursor)
+    btn_load.on_clicked(on_load_button)
+
+    # 마우스 클릭 이벤트 연결
+    fig.canvas.mpl_connect('button_press_event', on_click)
 
-# 하단: 슬라이더 영역
-ax_slider_area = plt.subplot(gs[2, 2])
-ax_slider_area.axis('off')
 
 # 그래프에 표시할 필드와 해당 색상, 심볼 정의 (확장 가능)
 plot_field_config = {
@@ -638,7 +845,178 @@ plot_field_config = {
     }
 }
 
-fields_to_plot = list(plot_field_config.keys())  # 설정된 필드들만 그래프로 표시
+# 설정은 실행 중 바뀌지 않으므로 한 번만 만들어 재사용
+_PLOT_FIELDS = tuple(plot_field_config.keys())
+
+@lru_cache(maxsize=512)
+def resolve_field_style(field):
+    """필드 표시 스타일 (색상, 값 앞 문구, 값 뒤 문구, 그래프 필드 여부) - 필드별로 한 번만 계산"""
+    field_config = plot_field_config.get(field)
+    if field_config is None:
+        return 'black', f"{field}: ", "", False
+    unit = field_config.get("unit", "")
+    return (field_config["color"], f"{field_config['emoji']} {field}: ",
+            f" {unit}" if unit else "", True)
+
+fields_to_plot = _PLOT_FIELDS  # 설정된 필드들만 그래프로 표시
+
+# 그래프용 열 저장소 (data_rows와 같은 순서/길이 유지, lock 보호)
+# 필드별 연속 numpy 배열: 유효 구간 [시작, 끝)만 사용하고, 끝에 닿으면 최근 데이터를 앞으로 당김
+# (용량을 2배로 잡아 당기기는 MAX_DATA_POINTS개 추가마다 한 번만 발생)
+_COL_CAPACITY = 2 * MAX_DATA_POINTS
+_ts_buf = np.empty(_COL_CAPACITY, dtype='f8')
+_col_bufs = {field: np.empty(_COL_CAPACITY, dtype='f4') for field in _PLOT_FIELDS}
+_col_span = [0, 0]  # [시작, 끝) 인덱스
+# 필드별 마지막 유효값 위치 (수신 시 갱신, 시작 인덱스 이상이면 현재 구간에 값이 있음)
+_last_valid = {field: -1 for field in _PLOT_FIELDS}
+
+_NAN = float('nan')
+
+def _to_float(value):
+    """그래프 값 변환 (없거나 숫자가 아니면 NaN)"""
+    if value is None:  # 필드 없음: 예외 처리 없이 바로 NaN
+        return _NAN
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return _NAN
+
+def display_items(parsed_data):
+    """패널 표시용 (필드, 표시 문자열, 색상, 그래프 필드 여부) 튜플 - 행마다 한 번만 계산 (STATE 제외)"""
+    items = []
+    for field, value in parsed_data.items():
+        if field == 'STATE':  # STATE는 패널에서 따로 표시
+            continue
+        color, prefix, suffix, is_plot_field = resolve_field_style(field)
+        items.append((field, f"{prefix}{value}{suffix}", color, is_plot_field))
+    return tuple(items)
+
+def append_row(timestamp, parsed_data, items=None):
+    """행 추가: data_rows와 그래프 열에 함께 저장 (lock 보유 상태에서 호출)
+    
+    행 형식: [시간, 데이터 딕셔너리, 패널 표시용 튜플]
+    items는 lock 밖에서 display_items()로 미리 만들어 넘기면 lock 구간이 짧아짐"""
+    if items is None:
+        items = display_items(parsed_data)
+    data_rows.append([timestamp, parsed_data, items])
+    
+    start, end = _col_span
+    if end == _COL_CAPACITY:
+        # 버퍼 끝 도달: 최근 MAX_DATA_POINTS-1개를 앞으로 복사
+        keep = MAX_DATA_POINTS - 1
+        shift = end - keep
+        _ts_buf[:keep] = _ts_buf[shift:end]
+        for buf in _col_bufs.values():
+            buf[:keep] = buf[shift:end]
+        for field in _last_valid:
+            _last_valid[field] -= shift
+        start, end = 0, keep
+    
+    _ts_buf[end] = timestamp
+    for field, buf in _col_bufs.items():
+        value = _to_float(parsed_data.get(field))
+        buf[end] = value
+        if value == value:  # NaN이 아님
+            _last_valid[field] = end
+    end += 1
+    
+    # data_rows(maxlen)와 같은 개수만 유지
+    if end - start > MAX_DATA_POINTS:
+        start = end - MAX_DATA_POINTS
+    _col_span[0] = start
+    _col_span[1] = end
+
+def reset_rows(rows=()):
+    """전체 행 교체: 비우고 rows로 다시 채움 (lock 보유 상태에서 호출)"""
+    data_rows.clear()
+    _col_span[0] = 0
+    _col_span[1] = 0
+    for field in _last_valid:
+        _last_valid[field] = -1
+    for row in rows:
+        append_row(*row)
+
+# 그래프 다운샘플링 (점이 많으면 LTTB로 모양을 유지하며 줄임)
+LTTB_THRESHOLD = 1000  # 이 개수를 넘으면 다운샘플링
+LTTB_POINTS = 800      # 다운샘플링 후 점 개수
+
+@njit(cache=True, fastmath=True)  # 입력은 NaN이 제거된 값만 (downsample_for_plot)
+def lttb_indices(xs, ys, n_out):
+    """Largest-Triangle-Three-Buckets: 남길 점의 인덱스 배열 (첫/마지막 점 포함)"""
+    n = xs.shape[0]
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        # 다음 구간 평균점
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(avg_start, avg_end):
+            avg_x += xs[j]
+            avg_y += ys[j]
+        count = avg_end - avg_start
+        avg_x /= count
+        avg_y /= count
+        
+        # 현재 구간에서 삼각형 면적이 가장 큰 점 선택
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        ax_ = xs[a]
+        ay_ = ys[a]
+        max_area = -1.0
+        next_a = range_start
+        for j in range(range_start, range_end):
+            area = abs((ax_ - avg_x) * (ys[j] - ay_) - (ax_ - xs[j]) * (avg_y - ay_))
+            if area > max_area:
+                max_area = area
+                next_a = j
+        out[i + 1] = next_a
+        a = next_a
+    return out
+
+def downsample_for_plot(xs, ys):
+    """그래프용 다운샘플링 (NaN 제외 후 LTTB_POINTS개로 축소, 적으면 그대로)"""
+    if len(xs) <= LTTB_THRESHOLD:
+        return xs, ys
+    valid = np.isfinite(ys)
+    xs = xs[valid]
+    ys = ys[valid].astype(np.float64)
+    if len(xs) <= LTTB_POINTS:
+        return xs, ys
+    idx = lttb_indices(xs, ys, LTTB_POINTS)
+    return xs[idx], ys[idx]
+
+def snapshot():
+    """그래프용 배열 복사본: (시간 배열, {필드: 값 배열}) - 연속 구간 슬라이스 복사
+    
+    현재 구간에 값이 하나라도 있는 필드만 포함 (설정 순서 유지)"""
+    with lock:
+        start, end = _col_span
+        ts = _ts_buf[start:end].copy()
+        cols = {field: buf[start:end].copy() for field, buf in _col_bufs.items()
+                if _last_valid[field] >= start}
+    return ts, cols
+
+def export_snapshot():
+    """CSV 저장용 복사본: (행 목록, 첫 행 기준 경과 초(정수) 목록)
+    
+    경과 초는 시간 열에서 한 번에 계산 (두 목록이 같은 시점이 되도록 lock 안에서 함께 복사)"""
+    with lock:
+        rows = list(data_rows)
+        start, end = _col_span
+        elapsed = _ts_buf[start:end] - _ts_buf[start] if end > start else _ts_buf[:0]
+    return rows, elapsed.astype(np.int64).tolist()
+
+def elapsed_times():
+    """첫 데이터 기준 경과 시간 배열 (뺄셈 결과가 새 배열이므로 별도 복사 불필요)"""
+    with lock:
+        start, end = _col_span
+        return _ts_buf[start:end] - _ts_buf[start]
+
 colors = ['b', 'g', 'r', 'c', 'm', 'y', 'k', '#ff8800', '#00ccff', '#aa00ff']  # fallback 색상
 lines = {}
 
@@ -646,11 +1024,14 @@ cursor_x = [0]
 cursor_line = None
 cursor_idx = [0]  # 현재 커서가 가리키는 데이터 인덱스
 cursor_active = [False]  # 커서가 활성화되었는지 여부
+graph_background = [None]  # 블리팅용 그래프 배경 캐시 (커서 라인 제외)
 update_timer = None
 
 slider = None
 btn_on = None
 btn_off = None
+btn_reset = None
+btn_load = None
 
 # 그래프 축들을 저장할 전역 변수
 all_graph_axes = []  # 모든 그래프 축들 (main + twin axes)
@@ -674,24 +1055,31 @@ def cleanup_on_exit():
     # 신호 파일들 정리
     try:
         # stop 신호 파일 생성 (disp 프로세스 종료용)
-        with open("stop_signal.txt", "w") as f:
+        with open(STOP_SIGNAL_PATH, "w") as f:
             f.write("stop")
         print("stop 신호 파일 생성됨")
         
         # 잠시 대기 후 모든 신호 파일 제거
         time.sleep(0.5)
-        for signal_file in ["start_signal.txt", "stop_signal.txt", "disp_running.lock", "disp_sim.py"]:
+        # 실행 위치와 관계없이 스크립트 폴더의 신호 파일을 정리
+        for signal_file in [START_SIGNAL_PATH, STOP_SIGNAL_PATH,
+                            os.path.join(SCRIPT_DIR, "disp_running.lock"),
+                            os.path.join(SCRIPT_DIR, "disp_sim.py")]:
             if os.path.exists(signal_file):
                 os.remove(signal_file)
-                print(f"{signal_file} 제거됨")
+                print(f"{os.path.basename(signal_file)} 제거됨")
     except Exception as e:
         print(f"신호 파일 정리 오류: {e}")
     
     # UDP 수신기 종료 대기
     global udp_thread
+    udp_stop_event.set()
     if udp_thread is not None and udp_thread.is_alive():
         print("UDP 수신기 종료 대기 중...")
-        time.sleep(0.5)
+        udp_thread.join(timeout=1.0)
+    
+    # 제어 신호 소켓 닫기
+    control_sock.close()
     
     print("시스템 정리 완료")
 
@@ -700,146 +1088,60 @@ atexit.register(cleanup_on_exit)
 
 def clear_all_graphs():
     """그래프 화면 완전 초기화"""
-    global lines, cursor_line, cursor_idx, cursor_active
+    global cursor_idx, cursor_active
     
     try:
-        # 모든 그래프 라인 제거
-        for field in lines:
-            if lines[field]:
-                for line in lines[field]:
-                    if line:
-                        line.remove()
-        lines.clear()
+        # 모든 그래프 선의 데이터 비우기 (축/선 객체는 재사용)
+        for line in lines.values():
+            line.set_data([], [])
         
-        # 커서 라인 제거
-        if cursor_line:
-            cursor_line.remove()
-            cursor_line = None
+        # 커서 라인 숨김
+        if cursor_line is not None:
+            cursor_line.set_visible(False)
         
         # 커서 상태 초기화
         cursor_idx[0] = 0
         cursor_active[0] = False
         cursor_x[0] = 0
         
-        # 그래프 영역 초기화
-        if 'ax_graph' in globals():
-            ax_graph.clear()
-            
         print("그래프 화면 초기화 완료")
         
     except Exception as e:
         print(f"그래프 초기화 오류: {e}")
 
-def get_field_indices():
-    # 헤더 없이 데이터만 들어오므로, 각 상태별 필드 인덱스 추정
-    # row = [timestamp, state, ...fields...]
-    indices = {}
-    for state, fields in state_fields.items():
-        for i, f in enumerate(fields):
-            indices[f] = i + 2  # 0:timestamp, 1:state
-    return indices
+# 상태 패널 고정 요소 (4가지 상태, 2x2 배치)
+STATE_PANEL_STATES = ("IDLE", "STARTUP", "MAIN_FUELING", "SHUTDOWN")
+STATE_PANEL_NAMES_KR = ("대기", "시작", "충전", "종료")
+STATE_PANEL_COLORS = ('lightblue', 'lightyellow', 'lightgreen', 'lightpink')
+
+# 한글-영문 상태명 매핑
+state_kr_to_en = {
+    "대기": "IDLE",
+    "시작": "STARTUP", 
+    "충전": "MAIN_FUELING",
+    "종료": "SHUTDOWN"
+}
 
-field_indices = get_field_indices()
+# 상태 패널 artist (최초 1회 생성 후 set_text 등으로 갱신)
+state_panel_artists = {}
 
-def update_state_panel(idx=None):
+def build_state_panel_artists():
+    """상태 패널의 제목/정보 박스/상태 박스/필드 텍스트를 한 번만 생성"""
     ax_state.clear()
     ax_state.axis('off')
+    ax_state.set_xlim(0, 1)
+    ax_state.set_ylim(0, 1)
     
     # 제목 (동적 폰트 크기)
     ax_state.text(0.5, 0.99, "시스템 상태 모니터링", fontsize=font_sizes['title'], fontweight='bold', 
                  ha='center', va='top', color='darkblue')
     
-    # 4가지 상태를 항상 표시 - 각각 고정된 영역 할당
-    states = ["IDLE", "STARTUP", "MAIN_FUELING", "SHUTDOWN"]
-    state_names_kr = ["대기", "시작", "충전", "종료"]
-    colors_state = ['lightblue', 'lightyellow', 'lightgreen', 'lightpink']
-    
-    # 한글-영문 상태명 매핑
-    state_kr_to_en = {
-        "대기": "IDLE",
-        "시작": "STARTUP", 
-        "충전": "MAIN_FUELING",
-        "종료": "SHUTDOWN"
-    }
-    
-    current = current_state[0] if not cursor_active[0] else None
-    cursor_data = None
-    
-    with lock:
-        if data_rows and cursor_active[0]:
-            if idx is None:
-                idx = cursor_idx[0] if cursor_idx[0] < len(data_rows) else len(data_rows) - 1
-            if idx < len(data_rows):
-                row = data_rows[idx]
-                if len(row) > 1 and isinstance(row[1], dict):
-                    current = row[1].get('STATE', 'UNKNOWN')
-                    # 한글 상태명을 영문으로 변환
-                    if current in state_kr_to_en:
-                        current = state_kr_to_en[current]
-                    cursor_data = [row[0], row[1].copy()]  # 복사본 생성
-        elif data_rows and not cursor_active[0]:
-            # 실시간 모드: 최신 데이터 사용
-            row = data_rows[-1]
-            if len(row) > 1 and isinstance(row[1], dict):
-                current = row[1].get('STATE', 'UNKNOWN')
-                # 한글 상태명을 영문으로 변환
-                if current in state_kr_to_en:
-                    current = state_kr_to_en[current]
-                cursor_data = [row[0], row[1].copy()]  # 복사본 생성
-    
-    # 커서 정보 표시 (커서 활성화시에만) - 깔끔한 박스로 표시
-    if cursor_active[0] and cursor_data:
-        timestamp = cursor_data[0] - (data_rows[0][0] if data_rows else 0)
-        
-        # 커서 정보를 하나의 박스에 정리해서 표시
-        cursor_info_lines = [f" 시간: {format_time(timestamp)}"]
-        
-        # 딕셔너리에서 그래프 표시 필드들의 값 수집
-        if len(cursor_data) > 1 and isinstance(cursor_data[1], dict):
-            data_dict = cursor_data[1]
-            for field_name, field_config in plot_field_config.items():
-                if field_name in data_dict:
-                    marker = field_config["emoji"]
-                    unit = field_config.get("unit", "")
-                    value = data_dict[field_name]
-                    value_text = f"{marker} {field_name}: {value}"
-                    if unit:
-                        value_text += f" {unit}"
-                    cursor_info_lines.append(value_text)
-        
-        # 하나의 박스에 모든 커서 정보 표시 (동적 폰트 크기)
-        cursor_text = "\n".join(cursor_info_lines)
-        ax_state.text(0.5, 0.93, cursor_text, fontsize=font_sizes['normal'], 
-                     fontweight='bold', color='darkred', ha='center', va='top',
-                     bbox=dict(boxstyle="round,pad=0.4", facecolor='lightyellow', 
-                              alpha=0.95, edgecolor='red', linewidth=2))
-    
-    # 실시간 모드일 때 SOC와 유량 표시 (커서 비활성화 시)
-    elif not cursor_active[0] and data_rows:
-        latest_row = data_rows[-1]
-        if len(latest_row) > 1 and isinstance(latest_row[1], dict):
-            data_dict = latest_row[1]
-            
-            # 실시간 정보를 하나의 박스에 정리해서 표시
-            live_info_lines = [f"[LIVE] 실시간 데이터"]
-            
-            # SOC와 유량만 표시
-            for field_name, field_config in plot_field_config.items():
-                if field_name in data_dict:
-                    marker = field_config["emoji"]
-                    unit = field_config.get("unit", "")
-                    value = data_dict[field_name]
-                    value_text = f"{marker} {field_name}: {value}"
-                    if unit:
-                        value_text += f" {unit}"
-                    live_info_lines.append(value_text)
-            
-            # 실시간 정보 박스 표시 (동적 폰트 크기)
-            live_text = "\n".join(live_info_lines)
-            ax_state.text(0.5, 0.93, live_text, fontsize=font_sizes['normal'], 
-                         fontweight='bold', color='darkgreen', ha='center', va='top',
-                         bbox=dict(boxstyle="round,pad=0.4", facecolor='lightgreen', 
-                                  alpha=0.95, edgecolor='darkgreen', linewidth=2))
+    # 커서/실시간 정보 박스 (내용과 색상은 매 갱신 시 변경)
+    info_text = ax_state.text(0.5, 0.93, "", fontsize=font_sizes['normal'], 
+                              fontweight='bold', color='darkred', ha='center', va='top',
+                              bbox=dict(boxstyle="round,pad=0.4", facecolor='lightyellow', 
+                                       alpha=0.95, edgecolor='red', linewidth=2),
+                              visible=False)
     
     # 4개 상태를 2x2 형태로 배치 - 확장된 크기와 간격
     available_height = 0.75  # 사용 가능한 높이 확장
@@ -858,103 +1160,181 @@ def update_state_panel(idx=None):
         (margin_x + box_width + gap_x, 0.75 - 2*box_height - gap_y)      # 우하단: SHUTDOWN
     ]
     
-    for i, (state, name_kr) in enumerate(zip(states, state_names_kr)):
+    # 필드 텍스트 공용 글꼴 2종 (그래프 필드: 굵게 9.5pt, 나머지: 8.5pt)
+    # 갱신 시 굵기/크기를 텍스트마다 따로 바꾸지 않고, 강조 여부가 바뀐 텍스트만 글꼴 교체
+    field_fonts = {True: fm.FontProperties(weight='bold', size=9.5),    # 폰트 크기: 7.5 → 9.5 (+2pt)
+                   False: fm.FontProperties(weight='normal', size=8.5)}  # 폰트 크기: 6.5 → 8.5 (+2pt)
+    
+    boxes = []
+    for i, (state, name_kr) in enumerate(zip(STATE_PANEL_STATES, STATE_PANEL_NAMES_KR)):
         x_start, y_start = positions[i]
         y_end = y_start
         actual_box_height = box_height * 0.9  # 실제 박스 높이 (10% 여백)
         
-        is_current = (state == current)
-        
         # 상태별 배경 박스 (2x2 형태)
-        if is_current:
-            # 현재 상태는 진한 색상과 테두리
-            ax_state.add_patch(plt.Rectangle((x_start, y_end), box_width, actual_box_height, 
-                                           facecolor=colors_state[i], alpha=0.9, 
-                                           edgecolor='darkblue', linewidth=3))
-        else:
-            # 비활성 상태는 연한 색상
-            ax_state.add_patch(plt.Rectangle((x_start, y_end), box_width, actual_box_height, 
-                                           facecolor='lightgray', alpha=0.5, 
-                                           edgecolor='gray', linewidth=1))
+        rect = plt.Rectangle((x_start, y_end), box_width, actual_box_height, 
+                             facecolor='lightgray', alpha=0.5, 
+                             edgecolor='gray', linewidth=1)
+        ax_state.add_patch(rect)
         
         # 상태명 표시 (박스 상단 중앙에 배경과 함께)
-        title_text = f"[{name_kr}] {state}"
-        ax_state.text(x_start + box_width/2, y_start + actual_box_height - 0.005, 
-                     title_text, 
-                     fontsize=9, fontweight='bold' if is_current else 'normal',
-                     color='darkblue' if is_current else 'gray',
-                     ha='center', va='top',
-                     bbox=dict(boxstyle="round,pad=0.15", 
-                              facecolor='white' if is_current else 'lightgray', 
-                              alpha=0.95, edgecolor='darkblue' if is_current else 'gray',
-                              linewidth=1.5))
-        
-        # 각 상태의 데이터 표시 (현재 상태 또는 커서 위치의 상태)
-        # 커서 활성화 시: 커서 위치의 각 상태별 데이터 표시
-        # 실시간 모드 시: 현재 상태만 데이터 표시
-        should_show_data = False
-        state_data_dict = None
+        title = ax_state.text(x_start + box_width/2, y_start + actual_box_height - 0.005, 
+                              f"[{name_kr}] {state}", 
+                              fontsize=9, fontweight='normal', color='gray',
+                              ha='center', va='top',
+                              bbox=dict(boxstyle="round,pad=0.15", facecolor='lightgray', 
+                                       alpha=0.95, edgecolor='gray', linewidth=1.5))
+        
+        # 필드 텍스트 자리 미리 생성 (박스 아래쪽 여백 안에 들어가는 줄만)
+        y_detail = y_start + actual_box_height - 0.05  # 상태명 아래부터 시작
+        max_lines = min(15, int((actual_box_height - 0.04) / 0.016))  # 더 많은 라인 표시
+        field_texts = []
+        for line_no in range(max_lines):
+            text_y = y_detail - (line_no * 0.016)
+            if text_y <= y_end + 0.01:
+                break
+            field_texts.append(ax_state.text(x_start + 0.01, text_y, "", 
+                                             fontproperties=field_fonts[False],
+                                             verticalalignment='top', visible=False))
+        # 텍스트별 마지막 표시 내용 (원문, 색상, 강조 여부) - 같으면 다시 설정하지 않음
+        field_shown = [None] * len(field_texts)
         
-        if cursor_active[0] and cursor_data:
-            # 커서 모드: 모든 상태에 데이터 표시 가능하도록 준비
-            should_show_data = (state == current)  # 현재 커서 위치의 상태만 표시
-            if should_show_data and len(cursor_data) > 1 and isinstance(cursor_data[1], dict):
-                state_data_dict = cursor_data[1]
-        elif is_current and cursor_data:
-            # 실시간 모드: 현재 활성 상태만 표시
-            should_show_data = True
-            if len(cursor_data) > 1 and isinstance(cursor_data[1], dict):
-                state_data_dict = cursor_data[1]
+        boxes.append((rect, title, field_texts, field_shown))
+    
+    state_panel_artists['info'] = info_text
+    state_panel_artists['boxes'] = boxes
+    state_panel_artists['field_fonts'] = field_fonts
+
+def update_state_panel(idx=None):
+    if not state_panel_artists:
+        build_state_panel_artists()
+    
+    current = current_state[0] if not cursor_active[0] else None
+    cursor_data = None
+    first_timestamp = 0
+    
+    # 전체 복사 없이 필요한 행만 lock 없이 읽음 (그 사이 비워지면 IndexError → 표시할 행 없음)
+    # 행 형식은 append_row가 보장하므로 ([시간, 딕셔너리, 표시용 튜플], STATE 항상 포함) 형식 검사 불필요
+    try:
+        first_timestamp = data_rows[0][0]
+        if cursor_active[0]:
+            count = len(data_rows)
+            if idx is None:
+                idx = min(cursor_idx[0], count - 1)
+            if idx < count:
+                cursor_data = data_rows[idx]
+        else:
+            # 실시간 모드: 최신 데이터 사용
+            cursor_data = data_rows[-1]
+    except IndexError:
+        cursor_data = None
+    if cursor_data is not None:
+        # 한글 상태명을 영문으로 변환
+        current = cursor_data[1]['STATE']
+        current = state_kr_to_en.get(current, current)
+    
+    info_text = state_panel_artists['info']
+    
+    # 커서 정보 표시 (커서 활성화시에만) - 깔끔한 박스로 표시
+    # 실시간 모드일 때는 그래프 표시 필드를 같은 자리에 표시
+    if cursor_data is not None:
+        if cursor_active[0]:
+            info_lines = [f" 시간: {format_time(cursor_data[0] - first_timestamp)}"]
+        else:
+            info_lines = [f"[LIVE] 실시간 데이터"]
+        
+        # 그래프 표시 필드들의 값 (수신 시 만든 표시 문자열 재사용, 설정 순서 유지)
+        plot_texts = {field: display_text 
+                      for field, display_text, _, is_plot_field in cursor_data[2] if is_plot_field}
+        for field_name in _PLOT_FIELDS:
+            if field_name in plot_texts:
+                info_lines.append(plot_texts[field_name])
+        
+        # 하나의 박스에 모든 정보 표시 (커서: 빨강/노랑, 실시간: 초록)
+        info_text.set_text("\n".join(info_lines))
+        bbox_patch = info_text.get_bbox_patch()
+        if cursor_active[0]:
+            info_text.set_color('darkred')
+            bbox_patch.set_facecolor('lightyellow')
+            bbox_patch.set_edgecolor('red')
+        else:
+            info_text.set_color('darkgreen')
+            bbox_patch.set_facecolor('lightgreen')
+            bbox_patch.set_edgecolor('darkgreen')
+        info_text.set_visible(True)
+    else:
+        info_text.set_visible(False)
+    
+    field_fonts = state_panel_artists['field_fonts']
+    for i, state in enumerate(STATE_PANEL_STATES):
+        rect, title, field_texts, field_shown = state_panel_artists['boxes'][i]
+        is_current = (state == current)
         
-        if should_show_data and state_data_dict:
-            y_detail = y_start + actual_box_height - 0.05  # 상태명 아래부터 시작
-            
-            # 박스 내에서 표시 가능한 최대 라인 수 계산
-            max_lines = min(15, int((actual_box_height - 0.04) / 0.016))  # 더 많은 라인 표시
-            
-            # 딕셔너리에서 모든 필드 표시 (STATE 제외)
-            field_count = 0
-            for field, value in state_data_dict.items():
-                if field == 'STATE':  # STATE는 이미 표시했으므로 제외
-                    continue
-                if field_count >= max_lines:  # 박스 크기 내에서만 표시
+        # 상태별 배경 박스: 현재 상태는 진한 색상과 테두리, 비활성 상태는 연한 색상
+        if is_current:
+            rect.set_facecolor(STATE_PANEL_COLORS[i])
+            rect.set_alpha(0.9)
+            rect.set_edgecolor('darkblue')
+            rect.set_linewidth(3)
+        else:
+            rect.set_facecolor('lightgray')
+            rect.set_alpha(0.5)
+            rect.set_edgecolor('gray')
+            rect.set_linewidth(1)
+        
+        # 상태명 강조
+        title.set_fontweight('bold' if is_current else 'normal')
+        title.set_color('darkblue' if is_current else 'gray')
+        title_bbox = title.get_bbox_patch()
+        title_bbox.set_facecolor('white' if is_current else 'lightgray')
+        title_bbox.set_edgecolor('darkblue' if is_current else 'gray')
+        
+        # 각 상태의 데이터 표시 (현재 상태 또는 커서 위치의 상태만)
+        row_items = ()
+        if is_current and cursor_data is not None:
+            row_items = cursor_data[2]
+        
+        # 수신 시 만들어 둔 필드 표시 목록 사용 (STATE 제외), 남는 자리는 숨김
+        field_count = 0
+        if row_items:
+            for field, display_text, color_text, is_plot_field in row_items:
+                if field_count >= len(field_texts):  # 박스 크기 내에서만 표시
                     break
                 
-                # 그래프 표시 필드는 강조 표시
-                if field in plot_field_config:
-                    field_config = plot_field_config[field]
-                    color_text = field_config["color"]
-                    weight_text = 'bold'
-                    marker = field_config["emoji"]
-                    unit = field_config.get("unit", "")
-                    display_text = f"{marker} {field}: {value}"
-                    if unit:
-                        display_text += f" {unit}"
-                    font_size = 9.5  # 폰트 크기: 7.5 → 9.5 (+2pt)
-                else:
-                    color_text = 'black'
-                    weight_text = 'normal'
-                    display_text = f"{field}: {value}"
-                    font_size = 8.5  # 폰트 크기: 6.5 → 8.5 (+2pt)
-                
-                # 텍스트 길이 제한 (박스에 맞춰 조정)
-                if len(display_text) > 28:
-                    display_text = display_text[:25] + "..."
-                
-                # Y 위치 계산 (더 촘촘한 라인 간격)
-                text_y = y_detail - (field_count * 0.016)
-                if text_y > y_end + 0.01:  # 박스 아래쪽 여백 확보
-                    ax_state.text(x_start + 0.01, text_y, display_text, fontsize=font_size, 
-                                color=color_text, fontweight=weight_text, 
-                                verticalalignment='top')
-                    field_count += 1
+                text = field_texts[field_count]
+                shown = field_shown[field_count]
+                if shown is None or shown[0] != display_text:
+                    field_shown[field_count] = (display_text, color_text, is_plot_field)
+                    # 텍스트 길이 제한 (박스에 맞춰 조정)
+                    if len(display_text) > 28:
+                        display_text = display_text[:25] + "..."
+                    text.set_text(display_text)
+                    if shown is None or shown[1] != color_text:
+                        text.set_color(color_text)
+                    # 그래프 표시 필드는 강조 글꼴 (바뀐 경우에만 교체)
+                    if shown is None or shown[2] != is_plot_field:
+                        text.set_fontproperties(field_fonts[is_plot_field])
+                text.set_visible(True)
+                field_count += 1
+        
+        for text in field_texts[field_count:]:
+            text.set_visible(False)
     
-    ax_state.set_xlim(0, 1)
-    ax_state.set_ylim(0, 1)
     fig.canvas.draw_idle()
 
-def update_current_values():
-    """현재 수신 값 패널 업데이트 (1초마다 최신 데이터 표시)"""
+# 현재 값 패널 artist (최초 1회 생성 후 set_text 등으로 갱신)
+current_panel_artists = {}
+
+# 현재 상태 표시 색상
+state_color_map = {
+    "IDLE": "lightblue",
+    "STARTUP": "lightyellow",
+    "MAIN_FUELING": "lightgreen",
+    "SHUTDOWN": "lightpink"
+}
+
+def build_current_panel_artists():
+    """현재 값 패널의 제목/대기 문구/상태/시간/필드 텍스트를 한 번만 생성"""
     ax_current.clear()
     ax_current.axis('off')
     ax_current.set_xlim(0, 1)
@@ -964,245 +1344,268 @@ def update_current_values():
     ax_current.text(0.5, 0.95, "실시간 수신 데이터", fontsize=16, fontweight='bold',  # 14 → 16
                    ha='center', va='top', color='darkgreen')
     
-    if not data_rows:
-        ax_current.text(0.5, 0.5, "데이터 수신 대기 중...", fontsize=14,  # 12 → 14
-                       ha='center', va='center', color='gray')
-        return
+    current_panel_artists['waiting'] = ax_current.text(
+        0.5, 0.5, "데이터 수신 대기 중...", fontsize=14,  # 12 → 14
+        ha='center', va='center', color='gray')
+    
+    # 현재 상태 표시 (상태별 색상은 갱신 시 적용)
+    current_panel_artists['state'] = ax_current.text(
+        0.5, 0.85, "", fontsize=14,  # 12 → 14
+        fontweight='bold', ha='center', va='center',
+        bbox=dict(boxstyle="round,pad=0.3", facecolor='lightgray', alpha=0.8),
+        visible=False)
+    
+    # 수신 시간 표시
+    current_panel_artists['time'] = ax_current.text(
+        0.5, 0.75, "", fontsize=12,  # 10 → 12
+        ha='center', va='center', visible=False)
+    
+    # 필드 값 자리 (최대 12개, Y 위치가 패널 아래를 벗어나지 않는 줄만)
+    field_texts = []
+    y_pos = 0.68  # 시작 위치를 조금 올림
+    for _ in range(12):
+        if y_pos <= 0.05:  # 하단 여백 확보
+            break
+        field_texts.append(ax_current.text(0.03, y_pos, "", fontsize=10, 
+                                           verticalalignment='center', visible=False))
+        y_pos -= 0.055  # 간격을 더 좁게 (0.07에서 0.055로)
+    current_panel_artists['fields'] = field_texts
+    # 필드 텍스트별 마지막 표시 내용 (표시 문자열, 색상, 강조 여부) - 같으면 다시 설정하지 않음
+    current_panel_artists['shown'] = [None] * len(field_texts)
+
+def update_current_values():
+    """현재 수신 값 패널 업데이트 (1초마다 최신 데이터 표시)"""
+    if not current_panel_artists:
+        build_current_panel_artists()
+    
+    waiting_text = current_panel_artists['waiting']
+    state_text = current_panel_artists['state']
+    time_text = current_panel_artists['time']
+    field_texts = current_panel_artists['fields']
+    
+    # 첫/최신 행만 lock 없이 읽음 (그 사이 비워지면 IndexError)
+    try:
+        first_timestamp = data_rows[0][0]
+        latest_row = data_rows[-1]
+    except IndexError:
+        latest_row = None
     
     # 최신 데이터 사용
-    latest_row = data_rows[-1]
-    if len(latest_row) < 2 or not isinstance(latest_row[1], dict):
+    if latest_row is None:
+        waiting_text.set_visible(True)
+        state_text.set_visible(False)
+        time_text.set_visible(False)
+        for text in field_texts:
+            text.set_visible(False)
         return
     
+    waiting_text.set_visible(False)
     data_dict = latest_row[1]
-    current_state_name = data_dict.get('STATE', 'UNKNOWN')
+    current_state_name = data_dict['STATE']
     
     # 현재 상태 표시 (상태별 색상 적용)
-    state_color_map = {
-        "IDLE": "lightblue",
-        "STARTUP": "lightyellow",
-        "MAIN_FUELING": "lightgreen",
-        "SHUTDOWN": "lightpink"
-    }
-    current_state_color = state_color_map.get(current_state_name, "lightgray")
-    
-    ax_current.text(0.5, 0.85, f"현재 상태: {current_state_name}", fontsize=14,  # 12 → 14
-                   fontweight='bold', ha='center', va='center',
-                   bbox=dict(boxstyle="round,pad=0.3", facecolor=current_state_color, alpha=0.8))
+    state_text.set_text(f"현재 상태: {current_state_name}")
+    state_text.get_bbox_patch().set_facecolor(state_color_map.get(current_state_name, "lightgray"))
+    state_text.set_visible(True)
     
     # 수신 시간 표시
-    current_time = latest_row[0] - (data_rows[0][0] if data_rows else 0)
-    ax_current.text(0.5, 0.75, f"수신 시간: {format_time(current_time)}", fontsize=12,  # 10 → 12
-                   ha='center', va='center')
+    current_time = latest_row[0] - first_timestamp
+    time_text.set_text(f"수신 시간: {format_time(current_time)}")
+    time_text.set_visible(True)
     
-    # 딕셔너리에서 모든 필드 값들 표시 (STATE 제외)
-    y_pos = 0.68  # 시작 위치를 조금 올림
+    # 수신 시 만들어 둔 필드 표시 목록 사용 (STATE 제외)
     field_count = 0
-    for field, value in data_dict.items():
-        if field == 'STATE':  # STATE는 이미 표시했으므로 제외
-            continue
-        if field_count >= 12:  # 최대 12개 필드 표시
+    field_shown = current_panel_artists['shown']
+    for field, display_text, color, is_plot_field in latest_row[2]:
+        if field_count >= len(field_texts):  # 최대 12개 필드 표시
             break
         
-        # 그래프 표시 필드는 강조
-        if field in plot_field_config:
-            field_config = plot_field_config[field]
-            color = field_config["color"]
-            marker = field_config["emoji"]
-            unit = field_config.get("unit", "")
-            display_text = f"{marker} {field}: {value}"
-            if unit:
-                display_text += f" {unit}"
-            font_weight = 'bold'
-            font_size = 11  # 폰트 크기: 9 → 11 (+2pt)
-        else:
-            color = 'black'
-            display_text = f"{field}: {value}"
-            font_weight = 'normal'
-            font_size = 10  # 폰트 크기: 8 → 10 (+2pt)
-        
-        # Y 위치가 패널 아래를 벗어나지 않도록 체크
-        if y_pos > 0.05:  # 하단 여백 확보
-            ax_current.text(0.03, y_pos, display_text, fontsize=font_size, 
-                           color=color, fontweight=font_weight, 
-                           verticalalignment='center')
-        
+        text = field_texts[field_count]
+        shown = field_shown[field_count]
+        if shown is None or shown[0] != display_text:
+            field_shown[field_count] = (display_text, color, is_plot_field)
+            text.set_text(display_text)
+            if shown is None or shown[1] != color:
+                text.set_color(color)
+            # 그래프 표시 필드는 강조
+            if shown is None or shown[2] != is_plot_field:
+                if is_plot_field:
+                    text.set_fontweight('bold')
+                    text.set_fontsize(11)  # 폰트 크기: 9 → 11 (+2pt)
+                else:
+                    text.set_fontweight('normal')
+                    text.set_fontsize(10)  # 폰트 크기: 8 → 10 (+2pt)
+        text.set_visible(True)
         field_count += 1
-        y_pos -= 0.055  # 간격을 더 좁게 (0.07에서 0.055로)
+    
+    for text in field_texts[field_count:]:
+        text.set_visible(False)
     
     fig.canvas.draw_idle()
 
-def update_graph():
-    global cursor_line, all_graph_axes
-    
-    # OFF 상태에서도 데이터가 있으면 그래프 표시 (CSV 로드 후 보기 위해)
-    # 단, 실시간 수신 중이 아닐 때만 (커서 모드)
-    if not data_on[0] and not cursor_active[0]:
-        # OFF 상태이고 커서도 비활성화면 그래프 업데이트 안함
-        return
-    
-    # ON 상태일 때만 축 정리 및 그래프 클리어
-    for ax in fig.get_axes():
-        if ax != ax_state and ax != ax_btn_area and ax != ax_slider_area:
-            if hasattr(ax, '_is_twin_axis'):
-                ax.remove()
+# 필드별 Y축 범위 고정
+GRAPH_YLIM = {
+    "SOC": (0, 100),
+    "유량": (0, 100),
+    "퓨얼링압력": (0, 800)
+}
+
+# 그래프 고정 요소 (축별 필드, 대기 문구, 현재 범례 필드)
+graph_axes = {}  # 필드 → 해당 필드 Y축 (첫 필드는 ax_graph, 나머지는 twin axis)
+graph_waiting_text = [None]
+graph_legend_fields = [None]
+
+def build_graph_artists():
+    """그래프 Y축/선/커서를 한 번만 생성 (필드마다 Y축 고정, 이후에는 set_data로 갱신)"""
+    global cursor_line
     
-    # 축 리스트 초기화
+    ax_graph.clear()
     all_graph_axes.clear()
     all_graph_axes.append(ax_graph)  # 메인 축 추가
     
-    # clear 호출 시 cursor_line도 자동으로 제거되므로 초기화
-    cursor_line = None
-    ax_graph.clear()
-    
-    with lock:
-        if not data_rows or len(data_rows) < 2:
-            ax_graph.text(0.5, 0.5, '[CHART] 데이터 대기 중...', transform=ax_graph.transAxes, 
-                         ha='center', va='center', fontsize=16, color='gray')
-            ax_graph.set_title(f"실시간 모니터링 - {'ON' if data_on[0] else 'OFF'}", 
-                              fontsize=14, fontweight='bold')
-            ax_graph.grid(True, linestyle=':', alpha=0.3)
-            fig.canvas.draw_idle()
-            return
-        
-        # 모든 데이터 포인트 표시 (누적)
-        recent_data = data_rows
-        xs = [row[0] - data_rows[0][0] for row in recent_data] if data_rows else []
-        
-        # 모든 데이터에서 사용 가능한 필드들을 동적으로 수집
-        all_fields = set()
-        for row in recent_data:
-            if len(row) > 1 and isinstance(row[1], dict):
-                all_fields.update(row[1].keys())
-        
-        # plot_field_config에 정의된 필드들 중 실제 데이터에 있는 것만 선택
-        # 순서를 명시적으로 지정하여 항상 같은 순서로 표시
-        preferred_order = ["SOC", "유량", "퓨얼링압력"]
-        graph_fields = [field for field in preferred_order if field in all_fields]
-        
-        axes_list = []  # Y축 리스트
-        plot_count = 0
-        
-        # 동적으로 발견된 필드들을 그래프로 표시
-        for i, field in enumerate(graph_fields):
-            ys = []
-            for row in recent_data:
-                val = None
-                if len(row) > 1 and isinstance(row[1], dict):
-                    field_value = row[1].get(field)
-                    if field_value is not None:
-                        try:
-                            val = float(field_value)
-                        except (ValueError, TypeError):
-                            val = None
-                ys.append(val)
-            
-            # None이 아닌 값이 하나라도 있으면 그래프에 추가
-            if any(y is not None for y in ys):
-                # 첫 번째 필드는 기본 Y축 사용
-                if plot_count == 0:
-                    current_ax = ax_graph
-                else:
-                    # 두 번째부터는 새로운 Y축 생성
-                    current_ax = ax_graph.twinx()
-                    current_ax._is_twin_axis = True  # 표시용
-                    all_graph_axes.append(current_ax)  # 클릭 감지용 리스트에 추가
-                    # Y축 위치 조정 (간격 더 축소)
-                    if plot_count > 1:
-                        current_ax.spines['right'].set_position(('outward', 35 * (plot_count - 1)))
-                
-                # 필드 설정에서 색상, 이모지, 단위 가져오기
-                field_config = plot_field_config.get(field, {})
-                color = field_config.get("color", colors[i % len(colors)])
-                marker_symbol = field_config.get("emoji", "�")
-                unit = field_config.get("unit", "")
-                label_text = f"{marker_symbol} {field}"
-                if unit:
-                    label_text += f" ({unit})"
-                
-                # 그래프 그리기
-                line = current_ax.plot(xs, ys, color=color, 
-                                     label=label_text, marker='o', markersize=3, 
-                                     linewidth=2.5, alpha=0.8)
-                
-                # Y축 색상을 그래프 색상과 동일하게 설정
-                current_ax.tick_params(axis='y', labelcolor=color, colors=color)
-                # Y축 레이블 제거 (숫자만 표시)
-                current_ax.set_ylabel('')
-                current_ax.spines['right'].set_color(color)
-                if plot_count == 0:
-                    current_ax.spines['left'].set_color(color)
-                
-                # Y축 범위 고정
-                if field == "SOC":
-                    current_ax.set_ylim(0, 100)
-                elif field == "유량":
-                    current_ax.set_ylim(0, 100)
-                elif field == "퓨얼링압력":
-                    current_ax.set_ylim(0, 800)
-                
-                axes_list.append((current_ax, label_text, color))
-                plot_count += 1
-        
-        # X축 커서 추가 (활성화된 경우에만)
-        if cursor_active[0] and xs and plot_count > 0:
-            # clear() 호출로 이미 모든 라인이 제거되었으므로 바로 새 커서 생성
-            global_cursor_idx = cursor_idx[0]
-            recent_start_idx = len(data_rows) - len(recent_data)
-            local_cursor_idx = global_cursor_idx - recent_start_idx
-            
-            if 0 <= local_cursor_idx < len(xs):
-                cursor_time = xs[local_cursor_idx]
-                # 새 커서 라인 생성 (clear 후이므로 안전)
-                cursor_line = ax_graph.axvline(x=cursor_time, color='red', linestyle='-', 
-                                             linewidth=2, alpha=0.8, zorder=10)
+    for i, field in enumerate(_PLOT_FIELDS):
+        # 첫 번째 필드는 기본 Y축 사용
+        if i == 0:
+            current_ax = ax_graph
+        else:
+            # 두 번째부터는 새로운 Y축 생성
+            current_ax = ax_graph.twinx()
+            all_graph_axes.append(current_ax)  # 클릭 감지용 리스트에 추가
+            # Y축 위치 조정 (간격 더 축소)
+            if i > 1:
+                current_ax.spines['right'].set_position(('outward', 35 * (i - 1)))
+        
+        # 필드 설정에서 색상, 이모지, 단위 가져오기
+        field_config = plot_field_config.get(field, {})
+        color = field_config.get("color", colors[i % len(colors)])
+        marker_symbol = field_config.get("emoji", "�")
+        unit = field_config.get("unit", "")
+        label_text = f"{marker_symbol} {field}"
+        if unit:
+            label_text += f" ({unit})"
+        
+        # 빈 선을 만들어 두고 갱신 시 데이터만 교체 (안티앨리어싱은 첫 필드만)
+        lines[field], = current_ax.plot([], [], color=color, 
+                                        label=label_text, marker='o', markersize=3, 
+                                        linewidth=2.5, alpha=0.8, antialiased=(i == 0))
+        
+        # Y축 색상을 그래프 색상과 동일하게 설정
+        current_ax.tick_params(axis='y', labelcolor=color, colors=color)
+        # Y축 레이블 제거 (숫자만 표시)
+        current_ax.set_ylabel('')
+        current_ax.spines['right'].set_color(color)
+        if i == 0:
+            current_ax.spines['left'].set_color(color)
+        
+        # Y축 범위 고정
+        if field in GRAPH_YLIM:
+            current_ax.set_ylim(*GRAPH_YLIM[field])
+        
+        graph_axes[field] = current_ax
+    
+    # X축 커서 (animated=True: 배경 캐시에서 제외하고 블리팅으로만 그림)
+    cursor_line = ax_graph.axvline(x=0, color='red', linestyle='-', 
+                                   linewidth=2, alpha=0.8, zorder=10,
+                                   animated=True, visible=False)
+    
+    graph_waiting_text[0] = ax_graph.text(0.5, 0.5, '[CHART] 데이터 대기 중...', transform=ax_graph.transAxes, 
+                                          ha='center', va='center', fontsize=16, color='gray')
     
     # 기본 축 설정
     ax_graph.set_xlabel("시간 (초)", fontsize=12, fontweight='bold')
-    ax_graph.set_title(f"실시간 모니터링 - {'ON' if data_on[0] else 'OFF'}", 
-                      fontsize=14, fontweight='bold')
     
     # X축을 분:초 형태로 표시 (0:00, 0:30, 1:00...)
-    from matplotlib.ticker import MaxNLocator
     ax_graph.xaxis.set_major_locator(MaxNLocator(integer=True))
-    ax_graph.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: format_time(x)))
-    
-    # 범례를 모든 축에서 수집해서 하나로 통합
-    if plot_count > 0:
-        all_lines = []
-        all_labels = []
-        for ax_item, label, color in axes_list:
-            lines = ax_item.get_lines()
-            if lines:
-                # 각 축의 첫 번째 라인만 추가 (커서 라인 제외)
-                for line in lines:
-                    if line.get_color() != 'red':  # 커서 라인 제외
-                        all_lines.append(line)
-                        all_labels.append(label)
-                        break  # 각 축당 하나의 라인만
-        
-        if all_lines:
-            # 범례를 버튼과 같은 높이에 배치
-            ax_graph.legend(all_lines, all_labels, bbox_to_anchor=(0.96, 1.12), 
-                           loc='upper right', fontsize=9, ncol=2, framealpha=0.9,
-                           columnspacing=0.5, handlelength=1.5)
+    ax_graph.xaxis.set_major_formatter(FuncFormatter(format_time_tick))
     
     # 격자는 기본 축에만
     ax_graph.grid(True, linestyle=':', alpha=0.4, zorder=0)
+    ax_graph.set_xlim(0, 50)  # 초기 범위
+
+def update_graph_legend(graph_fields):
+    """범례와 필드별 선/Y축 표시 여부는 표시 필드 구성이 바뀔 때만 갱신"""
+    if graph_legend_fields[0] == graph_fields:
+        return
+    graph_legend_fields[0] = graph_fields
+    
+    # 값이 없는 필드는 선과 보조 Y축을 숨김 (축은 지우지 않으므로 위치/스파인 유지)
+    for field, line in lines.items():
+        shown = field in graph_fields
+        line.set_visible(shown)
+        if line.axes is not ax_graph:
+            line.axes.set_visible(shown)
+    
+    legend = ax_graph.get_legend()
+    if legend is not None:
+        legend.remove()
+    if graph_fields:
+        # 범례를 버튼과 같은 높이에 배치
+        field_lines = [lines[field] for field in graph_fields]
+        ax_graph.legend(field_lines, [line.get_label() for line in field_lines], 
+                        bbox_to_anchor=(0.96, 1.12), 
+                        loc='upper right', fontsize=9, ncol=2, framealpha=0.9,
+                        columnspacing=0.5, handlelength=1.5)
+
+def update_graph():
+    # OFF 상태에서도 데이터가 있으면 그래프 표시 (CSV 로드 후 보기 위해)
+    # 단, 실시간 수신 중이 아닐 때만 (커서 모드)
+    if not data_on[0] and not cursor_active[0]:
+        # OFF 상태이고 커서도 비활성화면 그래프 업데이트 안함
+        return
+    
+    if not lines:
+        build_graph_artists()
+    
+    graph_background[0] = None  # 배경 캐시 무효화 (다음 전체 그리기에서 갱신)
+    ax_graph.set_title(f"실시간 모니터링 - {'ON' if data_on[0] else 'OFF'}", 
+                      fontsize=14, fontweight='bold')
+    
+    ts, cols = snapshot()
+    if len(ts) < 2:
+        for line in lines.values():
+            line.set_data([], [])
+        cursor_line.set_visible(False)
+        graph_waiting_text[0].set_visible(True)
+        update_graph_legend(())
+        fig.canvas.draw_idle()
+        return
+    graph_waiting_text[0].set_visible(False)
+    
+    # 모든 데이터 포인트 표시 (누적)
+    xs = ts - ts[0]
+    
+    # 값이 하나라도 있는 필드만 표시 (설정 순서 유지), 나머지는 빈 선
+    graph_fields = []
+    for field in _PLOT_FIELDS:
+        ys = cols.get(field)  # 값이 없는 지점은 NaN (선이 끊어짐)
+        if ys is None:
+            lines[field].set_data([], [])
+            continue
+        # 긴 데이터는 다운샘플링
+        plot_xs, plot_ys = downsample_for_plot(xs, ys)
+        lines[field].set_data(plot_xs, plot_ys)
+        graph_fields.append(field)
+    update_graph_legend(tuple(graph_fields))
+    
+    # X축 커서 (활성화된 경우에만 표시)
+    local_cursor_idx = cursor_idx[0]
+    if cursor_active[0] and graph_fields and 0 <= local_cursor_idx < len(xs):
+        cursor_time = float(xs[local_cursor_idx])
+        cursor_line.set_xdata([cursor_time, cursor_time])
+        cursor_line.set_visible(True)
+    else:
+        cursor_line.set_visible(False)
     
     # X축 범위 설정 (시간이 계속 늘어나도록)
-    if xs:
-        x_min = min(xs)
-        x_max = max(xs)
-        x_range = x_max - x_min
-        if x_range > 0:
-            # 데이터 범위에 여백 추가
-            padding = x_range * 0.02
-            ax_graph.set_xlim(x_min - padding, x_max + padding)
-        else:
-            ax_graph.set_xlim(0, 10)  # 기본 범위
+    x_min = float(xs[0])
+    x_max = float(xs[-1])
+    x_range = x_max - x_min
+    if x_range > 0:
+        # 데이터 범위에 여백 추가
+        padding = x_range * 0.02
+        ax_graph.set_xlim(x_min - padding, x_max + padding)
     else:
-        ax_graph.set_xlim(0, 50)  # 초기 범위
+        ax_graph.set_xlim(0, 10)  # 기본 범위
     
     # 레이아웃은 이미 subplots_adjust로 설정됨
     
@@ -1215,10 +1618,41 @@ def update_graph():
     
     fig.canvas.draw_idle()
 
+def on_draw(event):
+    """전체 그리기 직후 그래프 배경 캐시 (animated 커서 라인은 제외된 상태)"""
+    if not getattr(fig.canvas, 'supports_blit', False):
+        return
+    graph_background[0] = fig.canvas.copy_from_bbox(ax_graph.bbox)
+    if cursor_line is not None:
+        ax_graph.draw_artist(cursor_line)
+
+def blit_cursor():
+    """커서 라인만 다시 그리기 (정적인 축/텍스트는 캐시된 배경에서 복원)"""
+    if graph_background[0] is None or cursor_line is None:
+        # 배경 캐시가 없으면 (레이아웃 변경, 첫 그리기 전) 전체 다시 그리기
+        fig.canvas.draw_idle()
+        return
+    fig.canvas.restore_region(graph_background[0])
+    ax_graph.draw_artist(cursor_line)
+    fig.canvas.blit(ax_graph.bbox)
+
+def move_cursor_line(idx):
+    """커서 라인을 idx 위치로 이동 (그래프 전체를 다시 그리지 않음)"""
+    if cursor_line is None:
+        return
+    xs = elapsed_times()
+    if not 0 <= idx < len(xs):
+        return
+    cursor_time = float(xs[idx])
+    cursor_line.set_xdata([cursor_time, cursor_time])
+    cursor_line.set_visible(True)
+    blit_cursor()
+
 def on_slider(val):
     idx = int(val)
     cursor_active[0] = True  # 슬라이더 사용시에도 커서 활성화
     cursor_idx[0] = idx
+    move_cursor_line(idx)
 
 def on_click(event):
     """그래프 클릭 시 커서 활성화 및 이동"""
@@ -1235,40 +1669,52 @@ def on_click(event):
             is_graph_click = True
     
     if is_graph_click and event.xdata is not None:
-        with lock:
-            if not data_rows:
-                return
-            
-            # 첫 클릭시 커서 활성화
-            cursor_active[0] = True
-            
-            # 클릭한 x좌표에서 가장 가까운 데이터 포인트 찾기 (전체 데이터 사용)
-            if not data_rows:
-                return
-            xs = [row[0] - data_rows[0][0] for row in data_rows]  # 전체 데이터 기준
-            
-            # 클릭 위치와 가장 가까운 인덱스 찾기
-            closest_idx = min(range(len(xs)), key=lambda i: abs(xs[i] - event.xdata))
-            global_idx = closest_idx
-            
-            cursor_idx[0] = global_idx
-            
-            # 슬라이더가 있으면 동기화 (실시간 업데이트는 중단하지 않음)
-            if slider is not None:
-                slider.set_val(global_idx)
-            
-            # 상태 패널만 업데이트 (그래프는 periodic_update에서 계속 처리)
+        xs = elapsed_times()  # 전체 데이터 기준
+        if not len(xs):
+            return
+        
+        # 첫 클릭시 커서 활성화
+        cursor_active[0] = True
+        
+        # 클릭 위치와 가장 가까운 인덱스 찾기 (시간은 증가 순서이므로 이진 탐색)
+        closest_idx = int(np.searchsorted(xs, event.xdata))
+        if closest_idx == len(xs) or (closest_idx > 0 and 
+                event.xdata - xs[closest_idx - 1] < xs[closest_idx] - event.xdata):
+            closest_idx -= 1
+        global_idx = closest_idx
+        
+        cursor_idx[0] = global_idx
+        
+        # 슬라이더가 있으면 동기화 (on_slider에서 커서 라인 이동)
+        if slider is not None:
+            slider.set_val(global_idx)
+        else:
+            move_cursor_line(global_idx)
+        
+        # 상태 패널만 업데이트 (그래프는 periodic_update에서 계속 처리)
+
 
+# 마지막으로 그린 화면 상태 (바뀐 것이 없으면 다시 그리지 않음)
+last_render_key = [None]
 
 def update_all():
-    # 항상 그래프는 업데이트 (실시간 표시 유지)
-    update_graph()
+    # 데이터/커서/ON 상태가 지난 갱신과 같으면 전체 다시 그리기 생략
+    latest_row = data_rows[-1] if data_rows else None
+    render_key = (len(data_rows), id(latest_row), data_on[0], cursor_active[0], cursor_idx[0])
+    if render_key == last_render_key[0]:
+        return
+    # 커서 위치만 바뀐 경우: 커서 라인은 이미 블리팅되었으므로 그래프/현재 값은 그대로 둠
+    cursor_only = (last_render_key[0] is not None and render_key[:4] == last_render_key[0][:4])
+    last_render_key[0] = render_key
     
-    # 현재 값 패널 업데이트 (실시간으로 최신 데이터 표시)
-    update_current_values()
+    if not cursor_only:
+        # 그래프 업데이트 (실시간 표시 유지)
+        update_graph()
+        
+        # 현재 값 패널 업데이트 (실시간으로 최신 데이터 표시)
+        update_current_values()
     
-    with lock:
-        data_count = len(data_rows)
+    data_count = len(data_rows)  # len()은 원자적이므로 lock 불필요
     
     if data_count > 0:
         # 슬라이더 범위 업데이트
@@ -1295,6 +1741,9 @@ def periodic_update_callback():
     """고성능 타이머 콜백 함수 (성능 진단 포함)"""
     global slider
     
+    # 수신 스레드 로그 출력
+    drain_ring_log()
+    
     # OFF 상태이고 커서도 비활성화면 업데이트 안함
     if not data_on[0] and not cursor_active[0]:
         return
@@ -1303,8 +1752,7 @@ def periodic_update_callback():
     callback_start_time = time.perf_counter()
     
     try:
-        with lock:
-            data_count = len(data_rows)
+        data_count = len(data_rows)  # len()은 원자적이므로 lock 불필요
         
         # 슬라이더 동적 생성 (필요시에만)
         if slider is None and data_count > 1:
@@ -1328,19 +1776,22 @@ def periodic_update_callback():
         
         periodic_update_callback.callback_times.append(callback_duration)
         
+        # 갱신이 느려지면 타이머 간격을 늘려 GUI 스레드가 밀리지 않게 함 (측정 시간의 2배)
+        adjust_update_interval(callback_duration)
+        
         # 10초마다 성능 리포트
         current_time = time.time()
         if current_time - periodic_update_callback.last_perf_report >= 10.0:
             avg_time = sum(periodic_update_callback.callback_times) / len(periodic_update_callback.callback_times)
             max_time = max(periodic_update_callback.callback_times)
             
-            print(f"GUI 성능: 평균 {avg_time:.1f}ms, 최대 {max_time:.1f}ms, 데이터 {data_count}개")
+            logger.info("GUI 성능: 평균 %.1fms, 최대 %.1fms, 데이터 %d개", avg_time, max_time, data_count)
             
             # 성능 경고
             if avg_time > 100:  # 100ms 이상이면 경고
-                print("GUI 응답 속도 저하 감지 - 데이터 정리 권장")
+                logger.warning("GUI 응답 속도 저하 감지 - 데이터 정리 권장")
             elif avg_time < 50:  # 50ms 이하면 양호
-                print("GUI 응답 속도 양호")
+                logger.debug("GUI 응답 속도 양호")
             
             # 리스트 초기화
             periodic_update_callback.callback_times = []
@@ -1351,6 +1802,18 @@ def periodic_update_callback():
         import traceback
         traceback.print_exc()
 
+# 그래프 업데이트 주기 (기본 1초, 갱신이 느리면 최대 4초까지 늘림)
+UPDATE_INTERVAL_MS = 1000
+MAX_UPDATE_INTERVAL_MS = 4000
+update_cost_ms = [0.0]  # 갱신 소요 시간 이동 평균
+
+def adjust_update_interval(duration_ms):
+    """측정된 갱신 시간으로 다음 타이머 간격 결정 (간격이 바뀔 때만 적용)"""
+    update_cost_ms[0] = 0.8 * update_cost_ms[0] + 0.2 * duration_ms
+    interval = int(max(UPDATE_INTERVAL_MS, min(MAX_UPDATE_INTERVAL_MS, 2 * update_cost_ms[0])))
+    if update_timer is not None and abs(update_timer.interval - interval) >= 100:
+        update_timer.interval = interval
+
 def periodic_update():
     """고성능 타이머 설정 (정밀도 향상)"""
     global update_timer
@@ -1358,8 +1821,8 @@ def periodic_update():
     try:
         update_all()
         
-        # 그래프 업데이트 주기: 1초(1000ms) 고정
-        interval = 1000  # 1초
+        # 그래프 업데이트 주기: 기본 1초 (느려지면 adjust_update_interval에서 조정)
+        interval = UPDATE_INTERVAL_MS
         
         # 정밀 타이머 설정 (중복 방지 강화)
         if update_timer is None:
@@ -1378,50 +1841,45 @@ def periodic_update():
         import traceback
         traceback.print_exc()
 
+# virtual_data.txt 삭제 시도 횟수 (Windows는 다른 프로세스가 파일 핸들을 잠깐 쥐고 있을 수 있어 한 번 더)
+VIRTUAL_DATA_UNLINK_ATTEMPTS = 2 if sys.platform == 'win32' else 1
+
+def remove_virtual_data_file():
+    """virtual_data.txt 삭제 (없으면 바로 끝, 지워지지 않으면 이름을 바꿔 치워 둠)"""
+    for attempt in range(VIRTUAL_DATA_UNLINK_ATTEMPTS):
+        try:
+            os.unlink(VIRTUAL_DATA_FILE)
+            print("🗑️ virtual_data.txt 파일 정리됨")
+            return
+        except FileNotFoundError:
+            return
+        except OSError:
+            if attempt + 1 < VIRTUAL_DATA_UNLINK_ATTEMPTS:
+                time.sleep(0.05)
+    
+    # 삭제할 수 없으면 (다른 프로세스가 사용 중 등) 이름을 바꿔 치워 둠
+    try:
+        os.replace(VIRTUAL_DATA_FILE, f"{VIRTUAL_DATA_FILE}.stale.{int(time.time() * 1000)}")
+        print("🗑️ virtual_data.txt 파일 이름 변경으로 정리됨")
+    except OSError as e:
+        print(f"virtual_data.txt 이름 변경 실패: {e}")
+
 # ON/OFF 버튼 콜백
 def on_on(event):
-    global data_rows, current_sequence_index, udp_thread, last_received_data
-    # 처음부터 다시 시작: 데이터 및 CSV 파일 초기화
+    global data_rows, current_sequence_index, udp_thread
+    # 처음부터 다시 시작: 데이터 초기화 (메모리 데이터만, 실시간 CSV 파일 사용 안함)
     with lock:
-        data_rows.clear()
+        reset_rows()
     cursor_active[0] = False
     cursor_idx[0] = 0
     current_state[0] = "대기중"
+    print("모든 이전 데이터 완전 삭제")
     
-    # 메모리 데이터만 초기화 (실시간 CSV 파일 사용 안함)
-    print("데이터 메모리 초기화 완료")
-    
-    # 완전한 데이터 초기화 - 모든 이전 상태 제거
-    with duplicate_prevention_lock:
-        last_received_data["content"] = ""
-        last_received_data["timestamp"] = 0
-    
-    # 상태 순서 초기화
-    current_sequence_index[0] = 0  # IDLE부터 다시 시작
-    print("🔄 상태 순서 초기화: IDLE부터 시작")
+    # 기존 virtual_data.txt 파일 정리
+    remove_virtual_data_file()
     
-    # data_rows 완전 초기화 (global 선언 없이)
-    with lock:
-        data_rows.clear()
-        print("모든 이전 데이터 완전 삭제")
-    
-    # 기존 virtual_data.txt 파일 완전 정리 (반복적으로)
-    import os, time  # os 모듈 import를 여기로 이동
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    virtual_data_file = os.path.join(script_dir, "virtual_data.txt")
-    
-    # 강력한 파일 정리 - 여러 번 시도
-    for i in range(5):  # 5번 시도
-        if os.path.exists(virtual_data_file):
-            try:
-                os.remove(virtual_data_file)
-                print(f"🗑️ virtual_data.txt 파일 정리됨 (시도 {i+1})")
-            except:
-                pass
-        time.sleep(0.1)  # 0.1초 대기 후 재시도
-    
-    # 최종 확인
-    if not os.path.exists(virtual_data_file):
+    # 최종 확인 (로그만)
+    if not os.path.exists(VIRTUAL_DATA_FILE):
         print("virtual_data.txt 파일 완전히 정리 확인됨")
     else:
         print("virtual_data.txt 파일 정리 실패 - 강제 무시 모드 활성화")
@@ -1436,49 +1894,73 @@ def on_on(event):
     clear_all_graphs()
     
     # UDP 수신기 재시작 (기존 스레드 강제 정리)
+    # OFF에서 이미 종료 신호를 받았으므로 보통 select 한 주기(0.05초) 안에 끝나 있음
     if udp_thread is not None:
+        udp_stop_event.set()
         if udp_thread.is_alive():
             print("기존 UDP 수신기 종료 대기 중...")
-            # data_on을 False로 설정하여 기존 스레드 종료 유도
-            old_data_on = data_on[0]
-            data_on[0] = False
-            udp_thread.join(timeout=2.0)  # 최대 2초 대기
-            data_on[0] = old_data_on  # 원복
+            udp_thread.join(timeout=2.0)  # 포트를 넘겨받기 전 최대 2초 대기
         udp_thread = None
     
     # 새 UDP 수신기 시작
+    udp_stop_event.clear()
     udp_thread = threading.Thread(target=udp_receiver, daemon=True)
     udp_thread.start()
     print("새 UDP 수신기 스레드 시작됨")
     
     # disp.py에 UDP ON 신호 전송
     try:
-        # 기존 stop 신호 제거 (os는 이미 import됨)
-        signal_dir = os.path.dirname(os.path.abspath(__file__))
-        stop_signal_path = os.path.join(signal_dir, "stop_signal.txt")
-        start_signal_path = os.path.join(signal_dir, "start_signal.txt")
-        
-        if os.path.exists(stop_signal_path):
-            os.remove(stop_signal_path)
+        # 기존 stop 신호 제거
+        if os.path.exists(STOP_SIGNAL_PATH):
+            os.remove(STOP_SIGNAL_PATH)
         
         # UDP로 ON 신호 전송 (disp.py에게)
         try:
-            signal_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            signal_sock.sendto(b"ON", (DISP_IP, CONTROL_PORT))
-            signal_sock.close()
+            control_sock.sendto(b"ON", (DISP_IP, CONTROL_PORT))
             print(f"disp.py({DISP_IP}:{CONTROL_PORT})에 ON 신호 전송")
         except Exception as udp_error:
             print(f"UDP 신호 전송 실패: {udp_error}")
             # Fallback: 파일 신호
-            with open(start_signal_path, "w") as f:
+            with open(START_SIGNAL_PATH, "w") as f:
                 f.write("start\n")
-            print(f"📁 Fallback: 파일 신호 생성 {start_signal_path}")
+            print(f"📁 Fallback: 파일 신호 생성 {START_SIGNAL_PATH}")
     except Exception as e:
         print("신호 파일 생성 오류:", e)
 
+# CSV 저장: csv.writer 대신 상태 섹션마다 문자열 하나로 만들어 큰 버퍼 파일에 씀
+CSV_FILE_BUFFER = 1 << 20       # 파일 버퍼 1MB
+_CSV_SPECIAL = re.compile(r'[,"\r\n]')
+
+def csv_line(values):
+    """CSV 한 줄 (csv.writer 기본 형식과 동일: 특수문자가 있는 문자열만 따옴표, 줄끝 \\r\\n)"""
+    fields = []
+    for value in values:
+        if value is None:
+            fields.append("")
+        elif isinstance(value, str):
+            if _CSV_SPECIAL.search(value):
+                value = '"' + value.replace('"', '""') + '"'
+            fields.append(value)
+        else:
+            fields.append(str(value))
+    return ",".join(fields) + "\r\n"
+
+def save_in_background(custom_filename=None):
+    """현재 데이터 복사본을 작업 스레드에서 CSV로 저장 (UI 멈춤 없음)
+    
+    복사본은 호출 시점에 만들어 두므로 저장 중 ON으로 데이터가 초기화되어도 영향 없음.
+    daemon이 아닌 스레드라 프로그램 종료 시에도 저장을 끝까지 마침"""
+    rows, elapsed = export_snapshot()
+    threading.Thread(target=save_current_data, args=(custom_filename, rows, elapsed),
+                     name="csv-save").start()
+    print(f"CSV 저장 시작 ({len(rows)}개 레코드)")
+
 # 현재 데이터를 CSV 파일로 저장 (가독성 좋은 형태)
-def save_current_data(custom_filename=None):
-    if not data_rows:
+def save_current_data(custom_filename=None, rows=None, elapsed=None):
+    # 수신 스레드가 계속 추가해도 저장 내용이 고정되도록 복사본 사용 (파일 쓰는 동안 lock 보유 안 함)
+    if rows is None:
+        rows, elapsed = export_snapshot()
+    if not rows:
         print("저장할 데이터가 없습니다.")
         return
     
@@ -1494,71 +1976,74 @@ def save_current_data(custom_filename=None):
         # 기본 타임스탬프 파일명
         filename = f"monitoring_data_{timestamp}.csv"
     
+    # 임시 파일에 모두 쓴 뒤 이름을 바꿔 완성 (중간에 종료되어도 불완전한 CSV가 남지 않음)
+    tmp_filename = filename + ".tmp"
     try:
-        import csv
-        with open(filename, 'w', newline='', encoding='utf-8-sig') as f:  # BOM 추가로 한글 깨짐 방지
-            writer = csv.writer(f)
+        # BOM 추가로 한글 깨짐 방지
+        with open(tmp_filename, 'w', newline='', encoding='utf-8-sig', buffering=CSV_FILE_BUFFER) as f:
+            out = []  # 아직 쓰지 않은 줄
             
             # 전체 파일 헤더
-            writer.writerow(['수소 충전소 모니터링 데이터'])
-            writer.writerow([f'생성 시간: {datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'])
-            writer.writerow([f'총 데이터 수: {len(data_rows)}개'])
-            writer.writerow([])  # 빈 줄
+            out.append(csv_line(['수소 충전소 모니터링 데이터']))
+            out.append(csv_line([f'생성 시간: {datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")}']))
+            out.append(csv_line([f'총 데이터 수: {len(rows)}개']))
+            out.append("\r\n")  # 빈 줄
             
             # 상태별로 데이터 분리 및 저장
             current_state = None
             state_data = []
             
-            for row in data_rows:
-                # 시간 스탬프를 초 단위로 변환 (시작 시간 기준)
-                start_timestamp = data_rows[0][0] if data_rows else 0
-                relative_time = int(row[0] - start_timestamp)
+            # 행 형식은 append_row가 보장: [시간, 데이터 딕셔너리, 표시용 튜플]
+            # 시작 시간 기준 경과 초는 export_snapshot에서 시간 열로 한 번에 계산됨
+            for (_, data_dict, _), relative_time in zip(rows, elapsed):
+                row_state = data_dict['STATE']
                 
-                if len(row) >= 2 and isinstance(row[1], dict):
-                    row_state = row[1].get('STATE', 'UNKNOWN')
-                    data_dict = row[1]
+                # 상태가 변경되었을 때
+                if current_state != row_state:
+                    # 이전 상태 데이터 저장
+                    if current_state is not None and state_data:
+                        write_clean_state_section(out, current_state, state_data)
+                        out.append("\r\n")  # 상태 간 빈 줄
+                        f.writelines(out)  # 섹션 단위로 파일에 씀
+                        out.clear()
                     
-                    # 상태가 변경되었을 때
-                    if current_state != row_state:
-                        # 이전 상태 데이터 저장
-                        if current_state is not None and state_data:
-                            write_clean_state_section(writer, current_state, state_data)
-                            writer.writerow([])  # 상태 간 빈 줄
-                        
-                        # 새 상태 시작
-                        current_state = row_state
-                        state_data = [(relative_time, data_dict)]
-                    else:
-                        state_data.append((relative_time, data_dict))
+                    # 새 상태 시작
+                    current_state = row_state
+                    state_data = [(relative_time, data_dict)]
+                else:
+                    state_data.append((relative_time, data_dict))
             
             # 마지막 상태 데이터 저장
             if current_state is not None and state_data:
-                write_clean_state_section(writer, current_state, state_data)
+                write_clean_state_section(out, current_state, state_data)
+            f.writelines(out)
+            f.flush()
+            os.fsync(f.fileno())  # 디스크에 기록된 뒤에 이름 변경
+        os.replace(tmp_filename, filename)
         
-        print(f"데이터가 {filename}에 저장되었습니다. (총 {len(data_rows)}개 레코드)")
+        print(f"데이터가 {filename}에 저장되었습니다. (총 {len(rows)}개 레코드)")
     except Exception as e:
         print(f"데이터 저장 오류: {e}")
+        try:
+            os.remove(tmp_filename)
+        except OSError:
+            pass
+
+# 섹션 제목용 영문 → 한글 상태명
+STATE_NAMES_KR = dict(zip(STATE_PANEL_STATES, STATE_PANEL_NAMES_KR))
 
-def write_clean_state_section(writer, state, state_data):
-    """상태별 데이터 섹션을 가독성 좋게 작성"""
+def write_clean_state_section(out, state, state_data):
+    """상태별 데이터 섹션을 가독성 좋게 작성 (CSV 줄 문자열을 out 리스트에 추가)"""
     # 상태명과 설명 작성
-    state_names = {
-        "IDLE": "대기",
-        "STARTUP": "시작", 
-        "MAIN_FUELING": "충전",
-        "SHUTDOWN": "종료"
-    }
-    
-    writer.writerow([f"=== {state_names.get(state, state)} 상태 ==="])
+    out.append(csv_line([f"=== {STATE_NAMES_KR.get(state, state)} 상태 ==="]))
     
     if not state_data:
-        writer.writerow(["데이터 없음"])
+        out.append(csv_line(["데이터 없음"]))
         return
     
-    # 첫 번째 데이터에서 숫자형 필드들만 추출
+    # 첫 번째 데이터에서 숫자형 필드들만 추출 (섹션마다 한 번, 행 루프 밖에서)
     first_time, first_data = state_data[0]
     numeric_fields = []
-    
     # 숫자형 데이터만 필터링 (상태 제외)
     for field, value in first_data.items():
         if field == 'STATE':
@@ -1570,20 +2055,29 @@ def write_clean_state_section(writer, state, state_data):
             pass  # 숫자가 아닌 필드는 제외
     
     if not numeric_fields:
-        writer.writerow(["숫자형 데이터 없음"])
+        out.append(csv_line(["숫자형 데이터 없음"]))
         return
     
     # 깔끔한 헤더 작성 (시간 + 숫자형 필드들만)
     header = ['시간(초)'] + numeric_fields
-    writer.writerow(header)
+    out.append(csv_line(header))
     
-    # 데이터 작성 (숫자 값들만)
-    for time_val, data_dict in state_data:
-        row = [time_val]
-        for field in numeric_fields:
-            value = data_dict.get(field, '')
-            row.append(value)
-        writer.writerow(row)
+    # 데이터 작성 (숫자 값들만) - 섹션 본문 전체를 문자열 하나로 합쳐 추가
+    out.append("".join([csv_line([time_val, *[data_dict.get(field, '') for field in numeric_fields]])
+                        for time_val, data_dict in state_data]))
+
+# 대화상자 부모용 숨김 Tk 루트 (처음 필요할 때 한 번 만들고 계속 재사용)
+dialog_root = [None]
+
+def get_dialog_root():
+    """숨김 Tk 루트 반환 (대화상자마다 Tcl 인터프리터를 새로 만들고 없애지 않음)"""
+    if dialog_root[0] is None:
+        # PyInstaller 환경에서 안전한 tkinter import
+        import tkinter as tk
+        root = tk.Tk()
+        root.withdraw()  # 창 숨기기
+        dialog_root[0] = root
+    return dialog_root[0]
 
 def on_off(event):
     global data_rows, current_sequence_index
@@ -1603,21 +2097,15 @@ def on_off(event):
     # 데이터 저장 여부 확인 (PyInstaller 빌드 안전)
     if data_rows:  # 저장할 데이터가 있을 때만 물어봄
         try:
-            # PyInstaller 환경에서 안전한 tkinter import
-            import tkinter as tk
             from tkinter import messagebox
             
-            # 임시 루트 윈도우 생성 (보이지 않게)
-            root = tk.Tk()
-            root.withdraw()  # 창 숨기기
+            # 숨김 루트 윈도우 재사용 (보이지 않게)
+            root = get_dialog_root()
             
             # 저장 여부 묻기
             result = messagebox.askyesno("데이터 저장", 
                                        f"수신된 데이터({len(data_rows)}개 레코드)를\nCSV 파일로 저장하시겠습니까?",
-                                       icon='question')
-            
-            # 임시 윈도우 제거
-            root.destroy()
+                                       icon='question', parent=root)
             
             if result:  # 예를 선택한 경우
                 # 파일명 입력 받기
@@ -1631,13 +2119,13 @@ def on_off(event):
                 custom_name = simpledialog.askstring(
                     "파일명 입력",
                     "저장할 파일명을 입력하세요:\\n(확장자 .csv는 자동 추가됩니다)",
-                    initialvalue=default_name
+                    initialvalue=default_name, parent=root
                 )
                 
                 if custom_name:  # 파일명 입력했으면 저장
                     # 파일명에서 경로 구분자 제거 (보안 및 오류 방지)
                     custom_name = custom_name.replace('/', '_').replace('\\', '_').replace(':', '_')
-                    save_current_data(custom_name)
+                    save_in_background(custom_name)
                 else:
                     print("파일명을 입력하지 않아 저장을 취소했습니다.")
             else:
@@ -1658,15 +2146,14 @@ def on_off(event):
                 if custom_name:
                     # 파일명에서 경로 구분자 제거 (보안 및 오류 방지)
                     custom_name = custom_name.replace('/', '_').replace('\\', '_').replace(':', '_')
-                    save_current_data(custom_name)
+                    save_in_background(custom_name)
                 else:
-                    save_current_data(default_name)
+                    save_in_background(default_name)
             else:
                 print("데이터 저장을 취소했습니다.")
     
     # 임시 CSV 파일 정리 (있다면)
     try:
-        import os
         if os.path.exists(DATA_FILE):
             os.remove(DATA_FILE)
             print("임시 CSV 파일 정리 완료")
@@ -1676,171 +2163,235 @@ def on_off(event):
     # OFF 시에는 데이터를 유지 (그래프 화면 유지를 위해)
     print("데이터는 유지됨 (그래프 화면 유지)")
     
-    # UDP 스레드 완전 종료 대기
-    global udp_thread
-    if udp_thread is not None and udp_thread.is_alive():
-        print("UDP 수신기 종료 대기 중...")
-        udp_thread.join(timeout=3.0)  # 최대 3초 대기
-        if udp_thread.is_alive():
-            print("UDP 스레드 강제 종료 준비")
-        udp_thread = None
+    # UDP 수신기에 종료 신호만 보냄 (대기는 다음 ON 또는 프로그램 종료 시)
+    udp_stop_event.set()
     
     # UDP로 disp.py에 OFF 신호 전송
     try:
-        control_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        control_socket.sendto(b"OFF", (DISP_IP, CONTROL_PORT))
-        control_socket.close()
+        control_sock.sendto(b"OFF", (DISP_IP, CONTROL_PORT))
         print(f"disp.py({DISP_IP}:{CONTROL_PORT})에 OFF 신호 전송")
     except Exception as e:
         print(f"UDP STOP 신호 전송 실패: {e}")
         # 폴백: 파일 기반 신호
         try:
-            import os
             # start 신호 제거
-            if os.path.exists("start_signal.txt"):
-                os.remove("start_signal.txt")
+            if os.path.exists(START_SIGNAL_PATH):
+                os.remove(START_SIGNAL_PATH)
                 print("start 신호 파일 제거됨")
             
             # stop 신호 생성하여 disp.py에 중지 신호 전달
-            with open("stop_signal.txt", "w") as f:
+            with open(STOP_SIGNAL_PATH, "w") as f:
                 f.write("stop\n")
             print("stop 신호 파일 생성됨 (폴백)")
             
         except Exception as e2:
             print("파일 기반 신호 처리 오류:", e2)
 
+def _csv_cell_to_float(cell):
+    """CSV 칸 변환 (빈 칸은 NaN)"""
+    return float(cell) if cell.strip() else _NAN
+
+def parse_saved_section(state, header_fields, source, base_time=0.0):
+    """저장된 상태 섹션 하나를 np.loadtxt로 일괄 파싱하여 data_rows 형식으로 변환
+    
+    CSV의 상대 시간(초)에는 파싱된 배열의 시간 열에 base_time을 한 번에 더해 절대 타임스탬프로 변환"""
+    # 행/필드마다 float() 변환하는 대신 numpy C 파서로 섹션 전체를 한 번에 숫자 배열로 변환 (빈 값은 NaN)
+    # 숫자가 아닌 값이나 열 개수가 다른 행이 있으면 ValueError → 섹션 전체 건너뜀
+    try:
+        values = np.loadtxt(source, delimiter=',', ndmin=2, converters=_csv_cell_to_float)
+    except ValueError:
+        return []
+    if not values.size:
+        return []
+    values[:, 0] += base_time  # 시간 열 전체를 한 번에 변환 (NaN은 NaN 유지)
+    
+    rows = []
+    for time_val, *field_values in values.tolist():
+        if time_val != time_val:  # 시간 값이 숫자가 아닌 행 무시 (NaN)
+            continue
+        # 상태명은 섹션 전체가 같은 문자열 객체를 공유
+        data_dict = {'STATE': state}
+        data_dict.update((field, value) for field, value in zip(header_fields, field_values)
+                         if value == value)  # 빈 값(NaN) 제외
+        # data_rows 형식으로 변환: [timestamp, data_dict]
+        rows.append([time_val, data_dict])
+    return rows
+
+# CSV 불러오기 작업 스레드 → 메인 스레드 결과 전달용
+load_result_queue = queue.Queue()
+load_poll_timer = None
+load_in_progress = [False]
+
+def load_saved_csv(filename):
+    """저장된 CSV 파일을 파싱하여 data_rows 형식 목록 반환 (작업 스레드에서 실행)"""
+    # 파일 전체를 파이썬 문자열 목록으로 읽지 않고 mmap으로 섹션 경계만 탐색
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            print('저장된 데이터 없음')
+            return []
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    loaded_data = []
+    all_fields = set()  # 전체 섹션의 필드명 합집합
+    # CSV에서는 상대 시간(초)으로 저장되어 있으므로 현재 시간을 기준점으로 절대 타임스탬프로 변환
+    base_time = time.time()
+    try:
+        # 상태 섹션 시작 감지 ("=== 대기 상태 ===" 행, 메타데이터 행 이후에만 등장)
+        marker_pos = mm.find(b'\n===')
+        while marker_pos != -1:
+            marker_start = marker_pos + 1
+            marker_end = mm.find(b'\n', marker_start)
+            if marker_end == -1:
+                break
+            next_marker = mm.find(b'\n===', marker_end)
+            section_end = next_marker if next_marker != -1 else len(mm)
+            marker_pos = next_marker
+            
+            section_name = mm[marker_start:marker_end].decode('utf-8', errors='ignore').strip('= \r')
+            state = sys.intern(section_name.split()[0])  # 상태명만 추출
+            
+            # 헤더 행 감지 (시간(초)로 시작) - 없으면 "데이터 없음" 섹션
+            header_end = mm.find(b'\n', marker_end + 1, section_end)
+            if header_end == -1:
+                continue
+            header = mm[marker_end + 1:header_end].decode('utf-8', errors='ignore').strip()
+            if not header.startswith('시간(초),'):
+                continue
+            # 시간 제외한 필드명들 - intern하여 모든 행의 딕셔너리 키가 같은 문자열 객체를 공유
+            header_fields = tuple(sys.intern(field.strip()) for field in header.split(',')[1:])
+            all_fields.update(header_fields)
+            
+            # 섹션 본문 바이트를 그대로 numpy 파서에 전달
+            body = mm[header_end + 1:section_end]
+            if body.strip():
+                loaded_data.extend(parse_saved_section(state, header_fields, io.BytesIO(body), base_time))
+    finally:
+        mm.close()
+    
+    if not loaded_data:
+        return loaded_data
+    
+    # 로드된 데이터의 필드 확인 (디버그 모드에서만)
+    if _DEBUG:
+        print(f"로드된 데이터 필드: {all_fields}")
+    
+    return loaded_data
+
+def load_worker(filename, result_queue):
+    """CSV 파싱 작업 스레드: 결과 또는 예외를 큐로 전달 (화면은 건드리지 않음)"""
+    try:
+        result_queue.put((filename, load_saved_csv(filename), None))
+    except Exception as e:
+        result_queue.put((filename, None, e))
+
+def apply_loaded_data(filename, loaded_data):
+    """파싱된 데이터를 data_rows에 반영하고 화면 갱신 (메인 스레드에서만 호출)"""
+    # 기존 데이터를 로드된 데이터로 교체 (표시 문자열은 lock 밖에서 미리 조립)
+    rows = [(timestamp, data_dict, display_items(data_dict)) for timestamp, data_dict in loaded_data]
+    with lock:
+        reset_rows(rows)
+        row_count = len(data_rows)
+        kept_rows = [data_rows[i] for i in range(min(5, row_count))]
+        last_row = data_rows[-1][:2] if data_rows else None
+    
+    # 링 버퍼 용량(MAX_DATA_POINTS)을 넘으면 앞쪽 데이터는 버려지고 마지막 구간만 남음
+    if row_count < len(loaded_data):
+        print(f"경고: 레코드가 {len(loaded_data)}개로 최대 {MAX_DATA_POINTS}개를 넘어 "
+              f"마지막 {row_count}개만 표시됩니다")
+    
+    if kept_rows:
+        print(f"첫 데이터: {kept_rows[0][:2]}")
+        print(f"마지막 데이터: {last_row}")
+    
+    # 커서를 처음으로 설정
+    cursor_idx[0] = 0
+    cursor_active[0] = True
+    
+    print(f"CSV 파일 로드 완료: {filename}")
+    print(f"총 {row_count}개 레코드 로드됨")
+    print(f"첫 5개 데이터 샘플:")
+    for i, row in enumerate(kept_rows):
+        print(f"  [{i}] time={row[0]:.2f}, data={row[1]}")
+    
+    # 슬라이더 범위 업데이트
+    if slider is not None:
+        slider.valmax = max(1, row_count - 1)
+        slider.ax.set_xlim(0, slider.valmax)
+        slider.set_val(0)
+    
+    # 전체 업데이트 (상태 패널, 현재 값, 그래프) - draw_idle로 한 번만 다시 그림
+    # 이후 슬라이더/클릭으로 커서를 옮길 때는 커서 라인만 블리팅
+    update_all()
+    
+    print("CSV 로드 및 화면 업데이트 완료")
+
+def poll_load_result():
+    """타이머 콜백: 작업 스레드의 파싱 결과가 도착하면 메인 스레드에서 반영"""
+    try:
+        filename, loaded_data, error = load_result_queue.get_nowait()
+    except queue.Empty:
+        return
+    
+    load_poll_timer.stop()
+    load_in_progress[0] = False
+    
+    if error is not None:
+        import traceback
+        print(f"CSV 파일 로드 오류: {error}")
+        traceback.print_exception(type(error), error, error.__traceback__)
+        return
+    
+    if not loaded_data:
+        print('유효한 데이터를 찾을 수 없습니다.')
+        return
+    
+    try:
+        apply_loaded_data(filename, loaded_data)
+    except Exception as e:
+        import traceback
+        print(f"CSV 데이터 반영 오류: {e}")
+        traceback.print_exc()
+
 # 저장된 데이터 불러서 재생
 def replay_saved_data():
-    """저장된 CSV 파일을 불러와서 그래프로 표시"""
+    """저장된 CSV 파일을 선택하고 작업 스레드에서 불러오기 (UI 응답성 유지)"""
+    global load_poll_timer
+    
+    if load_in_progress[0]:
+        print("CSV 파일을 불러오는 중입니다.")
+        return
+    
     from tkinter import filedialog
-    import tkinter as tk
     
-    # 파일 선택 다이얼로그
-    root = tk.Tk()
-    root.withdraw()  # 메인 윈도우 숨기기
+    # 파일 선택 다이얼로그 (숨김 루트 윈도우 재사용)
     filename = filedialog.askopenfilename(
         title="CSV 파일 선택",
         filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-        initialdir="."
+        initialdir=".", parent=get_dialog_root()
     )
-    root.destroy()
     
     if not filename:
         print("파일 선택 취소됨")
         return
     
-    try:
-        with open(filename, newline='', encoding='utf-8-sig') as f:
-            reader = csv.reader(f)
-            rows = list(reader)
-        
-        if not rows:
-            print('저장된 데이터 없음')
-            return
-        
-        # 상태별 데이터 파싱
-        loaded_data = []
-        current_section = None
-        header_fields = []
-        
-        for row in rows:
-            if not row or not row[0]:
-                continue
-            
-            # 상태 섹션 시작 감지
-            if row[0].startswith('==='):
-                current_section = row[0].strip('= ')
-                continue
-            
-            # 헤더 행 감지 (시간(초)로 시작)
-            if row[0] == '시간(초)':
-                header_fields = row[1:]  # 시간 제외한 필드명들
-                continue
-            
-            # 메타데이터 행 건너뛰기
-            if any(x in row[0] for x in ['수소 충전소', '생성 시간', '총 데이터 수', '데이터 없음', '숫자형 데이터']):
-                continue
-            
-            # 실제 데이터 행 파싱
-            if header_fields and current_section:
-                try:
-                    time_val = float(row[0])
-                    data_dict = {'STATE': current_section.split()[0]}  # 상태명만 추출
-                    
-                    # 각 필드 값 추가
-                    for i, field in enumerate(header_fields):
-                        if i + 1 < len(row) and row[i + 1]:
-                            try:
-                                data_dict[field] = float(row[i + 1])
-                            except ValueError:
-                                data_dict[field] = row[i + 1]
-                    
-                    # data_rows 형식으로 변환: [timestamp, data_dict]
-                    loaded_data.append([time_val, data_dict])
-                except (ValueError, IndexError) as e:
-                    continue
-        
-        if not loaded_data:
-            print('유효한 데이터를 찾을 수 없습니다.')
-            return
-        
-        # 로드된 데이터의 필드 확인
-        sample_fields = set()
-        for row in loaded_data[:5]:  # 처음 5개 행에서 필드 확인
-            if len(row) > 1 and isinstance(row[1], dict):
-                sample_fields.update(row[1].keys())
-        print(f"로드된 데이터 필드: {sample_fields}")
-        
-        # CSV에서는 상대 시간(초)으로 저장되어 있으므로 절대 타임스탬프로 변환
-        import time as time_module
-        base_time = time_module.time()  # 현재 시간을 기준점으로
-        for row in loaded_data:
-            row[0] = base_time + row[0]  # 상대 시간을 절대 시간으로 변환
-        
-        print(f"첫 데이터: {loaded_data[0]}")
-        print(f"마지막 데이터: {loaded_data[-1]}")
-        
-        # 기존 데이터를 로드된 데이터로 교체
-        global data_rows, cursor_idx, cursor_active, slider
-        
-        with lock:
-            data_rows.clear()
-            data_rows.extend(loaded_data)
-        
-        # 커서를 처음으로 설정
-        cursor_idx[0] = 0
-        cursor_active[0] = True
-        
-        print(f"CSV 파일 로드 완료: {filename}")
-        print(f"총 {len(loaded_data)}개 레코드 로드됨")
-        print(f"첫 5개 데이터 샘플:")
-        for i, row in enumerate(loaded_data[:5]):
-            print(f"  [{i}] time={row[0]:.2f}, data={row[1]}")
-        
-        # 슬라이더 범위 업데이트
-        if slider is not None:
-            slider.valmax = max(1, len(loaded_data) - 1)
-            slider.ax.set_xlim(0, slider.valmax)
-            slider.set_val(0)
-        
-        # 전체 업데이트 (상태 패널, 현재 값, 그래프)
-        update_all()
-        
-        # 강제로 화면 새로고침
-        fig.canvas.draw()
-        fig.canvas.flush_events()
-        
-        print("CSV 로드 및 화면 업데이트 완료")
-        
-    except Exception as e:
-        import traceback
-        print(f"CSV 파일 로드 오류: {e}")
-        traceback.print_exc()
+    # 파일 읽기/파싱은 작업 스레드에서 수행
+    load_in_progress[0] = True
+    threading.Thread(target=load_worker, args=(filename, load_result_queue), daemon=True).start()
+    print(f"CSV 파일 불러오는 중: {filename}")
+    
+    # 50ms 간격으로 결과 확인 (matplotlib 타이머는 메인 스레드에서 실행됨)
+    if load_poll_timer is None:
+        load_poll_timer = fig.canvas.new_timer(interval=50)
+        load_poll_timer.add_callback(poll_load_result)
+    load_poll_timer.start()
 
 
 # 화면 크기 변경 시 레이아웃 자동 조정 함수
-def on_resize(event):
-    """화면 크기 변경 시 레이아웃 비율 유지"""
+resize_timer = None  # 크기 조절이 멈춘 뒤 한 번만 레이아웃 조정 (단발 타이머)
+RESIZE_SETTLE_MS = 50
+
+def apply_resize_layout():
+    """레이아웃 비율 유지 (크기 조절이 멈춘 뒤 한 번 실행)"""
     try:
         # 그리드 간격과 여백 재조정 - 비율 유지
         gs.update(hspace=0.08, wspace=0.10)
@@ -1850,19 +2401,15 @@ def on_resize(event):
     except Exception as e:
         print(f"레이아웃 조정 오류: {e}")
 
-# 화면 크기 변경 이벤트 연결
-fig.canvas.mpl_connect('resize_event', on_resize)
-
-# ON/OFF 버튼 생성 (왼쪽으로 이동)
-ax_btn_on = plt.axes([0.30, 0.93, 0.07, 0.04])
-ax_btn_off = plt.axes([0.38, 0.93, 0.07, 0.04])
-ax_btn_reset = plt.axes([0.46, 0.93, 0.08, 0.04])  # 커서 리셋 버튼
-ax_btn_load = plt.axes([0.55, 0.93, 0.08, 0.04])   # 불러오기 버튼 (SAVE 위치로 이동)
-
-btn_on = Button(ax_btn_on, 'ON', color='lightgreen', hovercolor='green')
-btn_off = Button(ax_btn_off, 'OFF', color='lightcoral', hovercolor='red')
-btn_reset = Button(ax_btn_reset, 'LIVE', color='white', hovercolor='blue')  # 기본은 색상 없음
-btn_load = Button(ax_btn_load, 'LOAD', color='lightgray', hovercolor='gray')
+def on_resize(event):
+    """화면 크기 변경 시 레이아웃 비율 유지 (드래그 중 연속 이벤트는 타이머를 다시 시작해 하나로 합침)"""
+    global resize_timer
+    if resize_timer is None:
+        resize_timer = fig.canvas.new_timer(interval=RESIZE_SETTLE_MS)
+        resize_timer.single_shot = True
+        resize_timer.add_callback(apply_resize_layout)
+    resize_timer.stop()
+    resize_timer.start()
 
 def on_reset_cursor(event):
     """커서 비활성화하고 실시간 모드로 전환"""
@@ -1874,30 +2421,23 @@ def on_load_button(event):
     """불러오기 버튼 클릭 시 CSV 파일 로드"""
     replay_saved_data()
 
-btn_on.on_clicked(on_on)
-btn_off.on_clicked(on_off)
-btn_reset.on_clicked(on_reset_cursor)
-btn_load.on_clicked(on_load_button)
-
-# 마우스 클릭 이벤트 연결
-fig.canvas.mpl_connect('button_press_event', on_click)
-
-
 # 타이머 시작 및 메인 루프
-try:
-    print("모니터링 시스템 시작 중...")
-    periodic_update()
-    print("그래프 창이 표시되었습니다. 창을 닫으면 프로그램이 종료됩니다.")
-    
-    # matplotlib 창이 열린 상태로 유지
-    plt.show(block=True)
-    
-except KeyboardInterrupt:
-    print("\n사용자에 의해 종료됨")
-except Exception as e:
-    import traceback
-    print(f"[오류] {e}")
-    traceback.print_exc()
-    input("엔터를 누르면 종료합니다...")
-finally:
-    print("모니터링 시스템 종료")
+if __name__ == "__main__":
+    try:
+        print("모니터링 시스템 시작 중...")
+        build_ui()
+        periodic_update()
+        print("그래프 창이 표시되었습니다. 창을 닫으면 프로그램이 종료됩니다.")
+    
+        # matplotlib 창이 열린 상태로 유지
+        plt.show(block=True)
+    
+    except KeyboardInterrupt:
+        print("\n사용자에 의해 종료됨")
+    except Exception as e:
+        import traceback
+        print(f"[오류] {e}")
+        traceback.print_exc()
+        input("엔터를 누르면 종료합니다...")
+    finally:
+        print("모니터링 시스템 종료")